@@ -0,0 +1,264 @@
+"""
+assets.py
+-------------------------------------------------------
+Central cache for every image under res/ and every font used
+by the game. Each PNG is read from disk once, converted to the
+display format, and every scaled variant is kept so sprites
+never touch the disk after their first use. Fonts are looked
+up once per (name, size, bold, italic).
+
+Counter labels ("Wood : 123") are composed from cached pieces:
+each character of the value is rendered once per font and
+colour, and the background with the label prefix already drawn
+is kept per prefix position, so a changed count costs one copy
+and a few glyph blits instead of a font render.
+
+Functions:
+
+load_image(path, size=None):
+    Returns the cached, display-converted surface for path,
+    scaled to size if given. The surface is shared, so callers
+    that draw onto it must copy() it first.
+
+load_font(name=None, size=24, bold=False, italic=False):
+    Returns the shared SysFont for the given style.
+
+render_text(font, text, color='black'):
+    Returns the cached rendering of a piece of text.
+
+format_count(value):
+    Formats a count, compactly (12.3K, 1.2M) once it is large.
+
+blit_counter(surface, font, prefix, value, color='black', **anchor):
+    Draws "prefix" + the formatted value onto surface from
+    cached glyphs.
+
+render_counter(background, font, prefix, value, color='black', **anchor):
+    Returns a copy of background with a counter label on it,
+    starting from a cached background + prefix composite.
+
+cache_stats():
+    Returns the hit/miss/disk-load counters of the cache.
+
+clear_cache():
+    Drops every cached surface, font and glyph and resets the counters.
+"""
+
+# Standard Library Imports
+
+# Third Party Imports
+import pygame
+
+# My Imports
+from cache import LRUCache
+from globals import COMPACTFROM, COUNTERCACHESIZE, GLYPHCACHESIZE
+
+
+_images = {}
+_fonts = {}
+_glyphs = LRUCache(GLYPHCACHESIZE)
+_counters = LRUCache(COUNTERCACHESIZE)
+STATS = {'hits': 0, 'misses': 0, 'loads': 0, 'fonts': 0}
+SUFFIXES = ('K', 'M', 'B', 'T')
+
+
+def _convert(image):
+    """
+    Converts a freshly loaded surface to the display pixel format.
+    -------------------------------------------------------
+    Conversion needs a display mode, so surfaces loaded before
+    pygame.display.set_mode() are returned untouched.
+    """
+    if pygame.display.get_surface() is None:
+        return image
+    return image.convert_alpha()
+
+
+def load_image(path, size=None):
+    """
+    Returns a cached surface for an image file.
+    -------------------------------------------------------
+    Parameters:
+        - path : str, path to the image (e.g. 'res/wood.png')
+        - size : Optional (width, height) to scale the image to
+
+    Returns:
+        - pygame.Surface shared between all callers; copy() it
+          before blitting anything onto it
+    """
+    if size is not None:
+        size = (int(size[0]), int(size[1]))
+    key = (path, size)
+
+    image = _images.get(key)
+    if image is not None:
+        STATS['hits'] += 1
+        return image
+    STATS['misses'] += 1
+
+    base = _images.get((path, None))
+    if base is None:
+        STATS['loads'] += 1
+        base = _convert(pygame.image.load(path))
+        _images[(path, None)] = base
+
+    image = base if size is None else pygame.transform.scale(base, size)
+    _images[key] = image
+    return image
+
+
+def load_font(name=None, size=24, bold=False, italic=False):
+    """
+    Returns a shared font for the given style.
+    -------------------------------------------------------
+    Parameters:
+        - name : system font name, None for the pygame default
+        - size : int, point size
+        - bold, italic : bool, font style
+
+    Returns:
+        - pygame.font.Font created on first request and reused
+          for every later request with the same key
+    """
+    key = (name, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        STATS['fonts'] += 1
+        font = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+        _fonts[key] = font
+    return font
+
+
+def render_text(font, text, color='black'):
+    """
+    Returns the cached rendering of a piece of text.
+    -------------------------------------------------------
+    Meant for the small, recurring pieces counters are built from
+    (label prefixes and single characters); the cache keeps the
+    GLYPHCACHESIZE most recently used pieces.
+
+    Parameters:
+        - font : pygame.font.Font (from load_font)
+        - text : str to render
+        - color : text colour
+
+    Returns:
+        - pygame.Surface shared between all callers; do not draw on it
+    """
+    key = (font, text, color)
+    glyph = _glyphs.get(key)
+    if glyph is None:
+        glyph = font.render(text, True, color)
+        _glyphs.put(key, glyph)
+    return glyph
+
+
+def format_count(value):
+    """
+    Formats a count for a counter label.
+    -------------------------------------------------------
+    Returns:
+        - str, exact below COMPACTFROM ('9999'), otherwise to one
+          decimal with a suffix ('12.3K', '1.2M', '4B')
+    """
+    if abs(value) < COMPACTFROM:
+        return str(value)
+    scaled = value
+    for suffix in SUFFIXES:
+        scaled /= 1000
+        if abs(round(scaled, 1)) < 1000 or suffix == SUFFIXES[-1]:
+            break
+    return f"{scaled:.1f}".rstrip('0').rstrip('.') + suffix
+
+
+def blit_counter(surface, font, prefix, value, color='black', **anchor):
+    """
+    Draws a counter label such as "Wood : 123" from cached glyphs.
+    -------------------------------------------------------
+    Parameters:
+        - surface : pygame.Surface to draw on
+        - font : pygame.font.Font (from load_font)
+        - prefix : label text before the value, e.g. "Wood : "
+        - value : int count, formatted with format_count
+        - color : text colour
+        - anchor : one pygame.Rect position for the whole label,
+          e.g. midright=(x, y)
+
+    Returns:
+        - pygame.Rect covering the drawn label
+    """
+    pieces = [render_text(font, prefix, color)] if prefix else []
+    pieces += [render_text(font, char, color) for char in format_count(value)]
+    rect = _label_rect(font, pieces, anchor)
+    _blit_pieces(surface, pieces, rect.left, rect.top)
+    return rect
+
+
+def render_counter(background, font, prefix, value, color='black', **anchor):
+    """
+    Returns a copy of background with a counter label drawn on it.
+    -------------------------------------------------------
+    Where the prefix lands depends only on the width of the value,
+    so the background with the prefix drawn at that spot is cached
+    (COUNTERCACHESIZE entries) and only the value glyphs are blitted
+    onto a copy of it.
+
+    Parameters:
+        - background : shared pygame.Surface (e.g. from load_image)
+        - font, prefix, value, color, anchor : as for blit_counter
+
+    Returns:
+        - new pygame.Surface the caller may draw on
+    """
+    head = render_text(font, prefix, color)
+    digits = [render_text(font, char, color) for char in format_count(value)]
+    rect = _label_rect(font, [head] + digits, anchor)
+
+    key = (background, font, prefix, color, rect.topleft)
+    base = _counters.get(key)
+    if base is None:
+        base = background.copy()
+        base.blit(head, rect.topleft)
+        _counters.put(key, base)
+
+    image = base.copy()
+    _blit_pieces(image, digits, rect.left + head.get_width(), rect.top)
+    return image
+
+
+def _label_rect(font, pieces, anchor):
+    """Rect of pieces laid side by side, placed by one pygame.Rect anchor."""
+    rect = pygame.Rect(0, 0, sum(piece.get_width() for piece in pieces), font.get_height())
+    for name, position in anchor.items():
+        setattr(rect, name, position)
+    return rect
+
+
+def _blit_pieces(surface, pieces, x, y):
+    """Blits pieces left to right starting at (x, y)."""
+    for piece in pieces:
+        surface.blit(piece, (x, y))
+        x += piece.get_width()
+
+
+def cache_stats():
+    """
+    Returns the current cache counters.
+    -------------------------------------------------------
+    Returns:
+        - dict with 'hits', 'misses', 'loads' (disk reads),
+          'fonts' (fonts created), 'entries' (cached surfaces),
+          and 'glyphs' / 'counters' (text piece and counter cache
+          hits, misses and entries)
+    """
+    return dict(STATS, entries=len(_images), glyphs=_glyphs.stats(), counters=_counters.stats())
+
+
+def clear_cache():
+    """Drops every cached surface, font and glyph and resets the counters."""
+    _images.clear()
+    _glyphs.clear()
+    _counters.clear()
+    _fonts.clear()
+    for key in STATS:
+        STATS[key] = 0
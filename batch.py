@@ -0,0 +1,234 @@
+"""
+batch.py
+-------------------------------------------------------
+Vectorized engine that simulates many colonies at once for
+balance testing. Resources and buildings for N colonies are
+2-D integer arrays (one row per colony, columns in
+player.RESOURCES / player.BUILDINGS order), and the game
+rules are array operations driven by matrices built from
+player.COSTMATRIX and player.YIELDPAIRS, the same tables the
+Player uses.
+
+Requires NumPy, which the game itself does not need.
+
+COSTS:
+    (buildings x resources) matrix of building costs.
+
+YIELDS:
+    (buildings x resources) matrix of daily production.
+
+ColonyBatch:
+    State of N colonies and the actions that change it.
+
+    - affordable(self):
+        (N x buildings) mask of what each colony can afford.
+
+    - gather(self, resources, mask=None):
+        Each colony gathers its chosen resource.
+
+    - build(self, buildings, mask=None):
+        Each colony constructs its chosen building if it can.
+
+    - sleep(self, days=1, mask=None):
+        Production, action reset and date advance for every colony.
+
+    - reset(self, mask=None):
+        Returns colonies to the starting state.
+
+    - step(self, build=None, gather=None):
+        One full day for every colony under a simple policy.
+
+    - player(self, index):
+        Copies one colony into a Player.
+"""
+
+# Standard Library Imports
+
+# Third Party Imports
+import numpy as np
+
+# My Imports
+from player import (Player, RESOURCES, BUILDINGS, RESOURCEINDEX, BUILDINGINDEX,
+                    COSTMATRIX, YIELDPAIRS, HOUSE, TOWNHALL)
+
+COSTS = np.array(COSTMATRIX, dtype=np.int64)
+
+YIELDS = np.zeros((len(BUILDINGS), len(RESOURCES)), dtype=np.int64)
+for _building, _resource in YIELDPAIRS:
+    YIELDS[_building, _resource] = 1
+
+BASEACTIONS = 3
+
+
+def _choices(choice, count, index):
+    """
+    Normalises a per-colony choice to an int array of column indices.
+    -------------------------------------------------------
+    Parameters:
+        - choice : name, column index, or array of indices with -1
+          meaning "nothing" for that colony
+        - count : number of colonies
+        - index : RESOURCEINDEX or BUILDINGINDEX for name lookups
+    """
+    if isinstance(choice, str):
+        choice = index[choice]
+    return np.broadcast_to(np.asarray(choice, dtype=np.int64), (count,))
+
+
+class ColonyBatch:
+    """
+    N colonies simulated in lockstep.
+    -------------------------------------------------------
+    Attributes:
+        - resources : (N x resources) int64 array
+        - buildings : (N x buildings) int64 array
+        - actions_left : (N,) int64 array
+        - days : (N,) int64 array of days each colony has slept through
+    """
+
+    def __init__(self, count):
+        """
+        -------------------------------------------------------
+        Parameters:
+            - count : number of colonies, all starting like a new Player
+        """
+        self.resources = np.zeros((count, len(RESOURCES)), dtype=np.int64)
+        self.buildings = np.zeros((count, len(BUILDINGS)), dtype=np.int64)
+        self.actions_left = np.full(count, BASEACTIONS, dtype=np.int64)
+        self.days = np.zeros(count, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.actions_left)
+
+    @classmethod
+    def from_players(cls, players):
+        """Builds a batch holding a copy of each Player's state."""
+        batch = cls(len(players))
+        for i, player in enumerate(players):
+            batch.resources[i] = player.resource_counts
+            batch.buildings[i] = player.building_counts
+            batch.actions_left[i] = player.actions_left
+        return batch
+
+    def player(self, index):
+        """
+        Copies one colony into a Player.
+        -------------------------------------------------------
+        Returns:
+            - Player with the colony's resources, buildings and actions
+        """
+        player = Player()
+        player.resources.assign(dict(zip(RESOURCES, self.resources[index].tolist())))
+        player.buildings.assign(dict(zip(BUILDINGS, self.buildings[index].tolist())))
+        player.actions_left = int(self.actions_left[index])
+        return player
+
+    def affordable(self):
+        """
+        Returns:
+            - (N x buildings) bool array, True where the colony holds
+              enough of every resource for the building
+        """
+        return (self.resources[:, None, :] >= COSTS[None, :, :]).all(axis=2)
+
+    def gather(self, resources, mask=None):
+        """
+        Each colony with an action left spends one gathering its
+        chosen resource (1 + one per house).
+        -------------------------------------------------------
+        Parameters:
+            - resources : resource name, column index, or (N,) array
+              of indices (-1 to skip a colony)
+            - mask : optional (N,) bool array of colonies that act
+
+        Returns:
+            - (N,) bool array of colonies that gathered
+        """
+        choice = _choices(resources, len(self), RESOURCEINDEX)
+        done = (choice >= 0) & (self.actions_left > 0)
+        if mask is not None:
+            done &= mask
+        rows = np.flatnonzero(done)
+        self.resources[rows, choice[rows]] += 1 + self.buildings[rows, HOUSE]
+        self.actions_left[rows] -= 1
+        return done
+
+    def build(self, buildings, mask=None):
+        """
+        Each colony with an action left constructs its chosen
+        building if it can afford it.
+        -------------------------------------------------------
+        Parameters:
+            - buildings : building name, column index, or (N,) array
+              of indices (-1 to skip a colony)
+            - mask : optional (N,) bool array of colonies that act
+
+        Returns:
+            - (N,) bool array of colonies that built
+        """
+        choice = _choices(buildings, len(self), BUILDINGINDEX)
+        cost = COSTS[np.maximum(choice, 0)]
+        done = (choice >= 0) & (self.actions_left > 0) & (self.resources >= cost).all(axis=1)
+        if mask is not None:
+            done &= mask
+        self.resources -= cost * done[:, None]
+        rows = np.flatnonzero(done)
+        self.buildings[rows, choice[rows]] += 1
+        self.actions_left[rows] -= 1
+        return done
+
+    def sleep(self, days=1, mask=None):
+        """
+        Ends the day: buildings produce for days, actions reset to
+        3 + town halls and the day count advances.
+        -------------------------------------------------------
+        Parameters:
+            - days : number of days slept through
+            - mask : optional (N,) bool array of colonies that sleep
+              (all of them by default)
+        """
+        if mask is None:
+            self.resources += (self.buildings @ YIELDS) * days
+            self.actions_left[:] = BASEACTIONS + self.buildings[:, TOWNHALL]
+            self.days += days
+            return
+        rows = np.flatnonzero(mask)
+        self.resources[rows] += (self.buildings[rows] @ YIELDS) * days
+        self.actions_left[rows] = BASEACTIONS + self.buildings[rows, TOWNHALL]
+        self.days[rows] += days
+
+    def reset(self, mask=None):
+        """
+        Returns colonies to the starting state of a new Player.
+        -------------------------------------------------------
+        Parameters:
+            - mask : optional (N,) bool array of colonies to reset
+              (all of them by default)
+        """
+        rows = slice(None) if mask is None else np.flatnonzero(mask)
+        self.resources[rows] = 0
+        self.buildings[rows] = 0
+        self.actions_left[rows] = BASEACTIONS
+        self.days[rows] = 0
+
+    def step(self, build=None, gather=None):
+        """
+        Simulates one full day for every colony.
+        -------------------------------------------------------
+        Each colony first tries to construct its chosen building,
+        then spends every remaining action gathering its chosen
+        resource, then sleeps.
+
+        Parameters:
+            - build : building choice(s) as for build(), or None
+            - gather : resource choice(s) as for gather(), or None
+        """
+        if build is not None:
+            self.build(build)
+        if gather is not None:
+            choice = _choices(gather, len(self), RESOURCEINDEX)
+            rows = np.flatnonzero((choice >= 0) & (self.actions_left > 0))
+            amount = (1 + self.buildings[rows, HOUSE]) * self.actions_left[rows]
+            self.resources[rows, choice[rows]] += amount
+            self.actions_left[rows] = 0
+        self.sleep()
@@ -0,0 +1,87 @@
+"""
+cache.py
+-------------------------------------------------------
+LRUCache - Small bounded mapping that evicts the least recently
+used entry once it holds maxsize items. Tracks hits and misses so
+callers can report how well a cache is doing.
+"""
+
+# Standard Library Imports
+from collections import OrderedDict
+
+# Third Party Imports
+
+# My Imports
+
+
+class LRUCache:
+    """Bounded least-recently-used cache with hit/miss counters."""
+
+    def __init__(self, maxsize):
+        """
+        -------------------------------------------------------
+        Parameters:
+            - maxsize : int, number of entries kept before evicting
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def get(self, key, default=None):
+        """
+        Returns the value for key and marks it most recently used.
+        -------------------------------------------------------
+        Returns:
+            - cached value, or default if key is not cached
+        """
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Stores value under key, evicting the oldest entry if full."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def evict(self):
+        """
+        Removes the least recently used entry.
+        -------------------------------------------------------
+        Returns:
+            - (key, value), or None if the cache is empty
+        """
+        if not self._data:
+            return None
+        return self._data.popitem(last=False)
+
+    def discard(self, key):
+        """Removes key if it is cached."""
+        self._data.pop(key, None)
+
+    def clear(self):
+        """Drops every entry; counters are kept."""
+        self._data.clear()
+
+    def stats(self):
+        """
+        Returns the cache counters.
+        -------------------------------------------------------
+        Returns:
+            - dict with 'hits', 'misses', 'entries' and 'maxsize'
+        """
+        return {'hits': self.hits, 'misses': self.misses,
+                'entries': len(self._data), 'maxsize': self.maxsize}
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
@@ -4,9 +4,23 @@ calendar_sprites.py
     WeekDay - Represents a weekday label at the top of the calendar
     Month - Displays the current month and year above the calendar
     MonthButton - Clickable button to navigate between months
+    CalendarView - Single sprite showing a fully composed month
+    render_month - Composes the title, weekdays and date blocks of a month
+    month_title - Cached month and year title surfaces
+    month_key - Cache key for a rendered month
+    month_weeks - Cached calendar.monthdayscalendar layout of a month
+    date_block_pool - Fixed pool of DateBlock sprites re-skinned per month
+    weekday_labels - WeekDay sprites shared by every rendered month
+    day_label - Cached day number surfaces
+    add_months - Steps a (year, month) pair forward or back
 """
 
 # Standard Library Imports
+import calendar
+import time
+from collections import deque
+from datetime import date
+from functools import lru_cache
 
 # Third Party Imports
 import pygame
@@ -14,10 +28,18 @@ import pygame
 # My Imports
 from sprites import Entity
 from globals import *
+from assets import load_image, load_font
+from cache import LRUCache
+
+DAYNAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+DATEBLOCKPOOLSIZE = 6 * 7   # the most weeks a month can span, times 7 days
+
+_date_block_pool = []
 
 
 class DateBlock(Entity):
     """Represents a single day block on the calendar grid."""
+    _layer = DATELAYER
     
     def __init__(self, groups, image=None, position=(0, 0)):
         """
@@ -34,10 +56,26 @@ class DateBlock(Entity):
             image = pygame.Surface((DATEWIDTH, DATEHEIGHT))
         super().__init__(groups, image, position)
         self.rect = image.get_rect(topleft=position)
+        self.day = 0
+
+    def reskin(self, skin, day):
+        """
+        Redraws this block in place for another day, reusing its surface.
+        ---------------------------------------------------
+        Parameters:
+            - skin : dateblock image (past/present/future) to draw
+            - day : int, day of the month shown in the corner
+        """
+        self.image.fill('lightblue')
+        self.image.blit(skin, (0, 0))
+        self.image.blit(day_label(day), (10, 10))
+        self.day = day
+        self.dirty = 1
 
 
 class WeekDay(Entity):
     """Represents a weekday label at the top of the calendar."""
+    _layer = CALENDARLAYER
     
     def __init__(self, groups, name=None, image=None, position=(0, 0), font_size=28):
         """
@@ -53,7 +91,7 @@ class WeekDay(Entity):
             - font_size : Font size for text rendering
         """
         if image is None and name is not None:
-            font = pygame.font.SysFont(None, font_size)
+            font = load_font(None, font_size)
             text_surf = font.render(name, True, 'black')
 
             image = pygame.Surface((DATEWIDTH, font_size), pygame.SRCALPHA)
@@ -66,6 +104,7 @@ class WeekDay(Entity):
 
 class Month(Entity):
     """Represents the month and year label on the calendar."""
+    _layer = CALENDARLAYER
     
     def __init__(self, groups, name=None, image=None, position=(0, 0), font_size=40):
         """
@@ -81,7 +120,7 @@ class Month(Entity):
             - font_size : Font size for text rendering
         """
         if image is None and name is not None:
-            font = pygame.font.SysFont(None, font_size)
+            font = load_font(None, font_size)
             text_surf = font.render(name, True, 'black')
 
             image_width = SCREENWIDTH // 2
@@ -96,6 +135,7 @@ class Month(Entity):
 
 class MonthButton(Entity):
     """Clickable button to navigate between months."""
+    _layer = CALENDARLAYER
     
     def __init__(self, groups, name=None, image=None, position=(0, 0)):
         """
@@ -115,3 +155,261 @@ class MonthButton(Entity):
 
         self.name = name
         super().__init__(groups, image, position)
+
+
+@lru_cache(maxsize=None)
+def month_weeks(year, month):
+    """
+    Returns the week layout of a month, computed once per month.
+    -------------------------------------------------------
+    Returns:
+        - tuple of weeks, each a tuple of 7 day numbers (0 = padding)
+    """
+    return tuple(tuple(week) for week in calendar.Calendar().monthdayscalendar(year, month))
+
+
+def add_months(year, month, step):
+    """
+    Returns the (year, month) that is step months away.
+    -------------------------------------------------------
+    Parameters:
+        - year, month : starting month
+        - step : int, positive to go forward, negative to go back
+    """
+    index = year * 12 + (month - 1) + step
+    return index // 12, index % 12 + 1
+
+
+@lru_cache(maxsize=None)
+def day_label(day):
+    """Returns the rendered day number drawn on a date block."""
+    return load_font(None, 28).render(str(day), True, 'black')
+
+
+@lru_cache(maxsize=None)
+def weekday_labels():
+    """
+    Returns the seven WeekDay label sprites, created once and reused by
+    every rendered month.
+    """
+    labels = []
+    for col, name in enumerate(DAYNAMES):
+        x = col * (DATEWIDTH + 4) + CALENDAROFFSETX
+        y = CALENDAROFFSETY - 40 - MONTHTITLEY
+        labels.append(WeekDay([], name=name, position=(x, y)))
+    return tuple(labels)
+
+
+def date_block_pool():
+    """
+    Returns the fixed pool of DateBlock sprites, one per calendar cell.
+    ---------------------------------------------------
+    Block i sits at row i // 7, column i % 7 of the grid (relative to the
+    calendar view). Blocks are created on first use and then re-skinned
+    in place for every month, so rendering allocates no sprites or
+    surfaces for days.
+    """
+    if not _date_block_pool:
+        for cell in range(DATEBLOCKPOOLSIZE):
+            row, col = divmod(cell, 7)
+            x = col * (DATEWIDTH + 4) + CALENDAROFFSETX
+            y = row * (DATEHEIGHT + 4) + CALENDAROFFSETY - MONTHTITLEY
+            _date_block_pool.append(DateBlock([], position=(x, y)))
+    return _date_block_pool
+
+
+def month_key(year, month, today):
+    """
+    Returns the cache key for a rendered month.
+    -------------------------------------------------------
+    Only the month containing today shows a 'present' block, so every
+    other month collapses today to 'past' or 'future'. Advancing the
+    day therefore only changes the key of the month(s) it touches.
+
+    Parameters:
+        - year, month : displayed month
+        - today : datetime.date of the current game day
+
+    Returns:
+        - tuple (year, month, today-or-marker)
+    """
+    if (year, month) == (today.year, today.month):
+        return (year, month, today)
+    if (year, month) < (today.year, today.month):
+        return (year, month, 'past')
+    return (year, month, 'future')
+
+
+@lru_cache(maxsize=MONTHCACHESIZE)
+def month_title(year, month):
+    """Returns the Month title sprite for a month, kept for recently rendered months."""
+    return Month([], name=f'{calendar.month_name[month]} {year}',
+                 position=(SCREENWIDTH // 4, 0))
+
+
+def render_month(year, month, today, surface=None):
+    """
+    Composes a whole month (title, weekday labels and date blocks) into
+    one surface covering the calendar area of the screen.
+    -------------------------------------------------------
+    Parameters:
+        - year, month : month to render
+        - today : datetime.date of the current game day
+        - surface : surface of that size to draw over (e.g. one evicted
+          from the month cache); a new one is created if None
+
+    Returns:
+        - pygame.Surface of size (SCREENWIDTH, SCREENHEIGHT - MONTHTITLEY)
+          meant to be drawn at (0, MONTHTITLEY)
+    """
+    if surface is None:
+        surface = pygame.Surface((SCREENWIDTH, SCREENHEIGHT - MONTHTITLEY))
+    surface.fill('lightblue')
+
+    title = month_title(year, month)
+    surface.blit(title.image, title.rect)
+
+    for label in weekday_labels():
+        surface.blit(label.image, label.rect)
+
+    pool = date_block_pool()
+    for row, week in enumerate(month_weeks(year, month)):
+        for col, day in enumerate(week):
+            if day == 0:
+                continue
+
+            block_date = date(year, month, day)
+            if block_date == today:
+                path = 'res/dateblock_present.png'
+            elif block_date < today:
+                path = 'res/dateblock_past.png'
+            else:
+                path = 'res/dateblock.png'
+
+            block = pool[row * 7 + col]
+            block.reskin(load_image(path, (DATEWIDTH, DATEHEIGHT)), day)
+            surface.blit(block.image, block.rect)
+
+    return surface
+
+
+class CalendarView(Entity):
+    """
+    Single sprite showing a fully composed month, cached per month.
+    Neighbouring months are rendered ahead of time, one per idle frame,
+    so month navigation normally finds its month already cached.
+    """
+    _layer = DATELAYER
+
+    def __init__(self, groups, cache_size=MONTHCACHESIZE, prefetch_radius=PREFETCHRADIUS):
+        """
+        Creates the calendar view covering the bottom of the screen.
+        ---------------------------------------------------
+        Inherited : Entity
+
+        Parameters:
+            - groups : list of pygame.sprite.Group to add this sprite to
+            - cache_size : number of rendered months kept in the LRU cache
+            - prefetch_radius : months on each side to render ahead
+
+        Attributes:
+            - cache : LRUCache of month_key -> composed surface
+            - title_rect : screen rect of the month title, used to place
+              the month buttons
+            - prefetch_queue : months waiting to be rendered ahead
+        """
+        self.cache = LRUCache(cache_size)
+        self.prefetch_radius = prefetch_radius
+        self.prefetch_queue = deque()
+        self._prefetched = set()   # keys rendered ahead and not yet shown
+        self.prefetch_count = 0
+        self.prefetch_hits = 0
+        self.prefetch_time = 0.0
+        self.title_rect = pygame.Rect(SCREENWIDTH // 4, MONTHTITLEY, SCREENWIDTH // 2, 50)
+        image = pygame.Surface((SCREENWIDTH, SCREENHEIGHT - MONTHTITLEY))
+        image.fill('lightblue')
+        super().__init__(groups, image, (0, MONTHTITLEY))
+
+    def show(self, year, month, today):
+        """
+        Displays a month, rendering it only if it is not cached.
+        ---------------------------------------------------
+        Parameters:
+            - year, month : month to display
+            - today : datetime.date of the current game day
+        """
+        key = month_key(year, month, today)
+        image = self.cache.get(key)
+        if image is None:
+            image = self.render(key, year, month, today)
+        elif key in self._prefetched:
+            self.prefetch_hits += 1
+        self._prefetched.discard(key)
+        self.image = image
+        self.prefetch(year, month, today)
+
+    def render(self, key, year, month, today):
+        """
+        Renders a month into the cache under key. Once the cache is full,
+        the least recently used month's surface is drawn over instead of
+        allocating a new one (unless it is the one on screen).
+        ---------------------------------------------------
+        Returns:
+            - the rendered surface
+        """
+        surface = None
+        if len(self.cache) >= self.cache.maxsize:
+            old_key, surface = self.cache.evict()
+            self._prefetched.discard(old_key)
+            if surface is self.image:
+                surface = None
+        surface = render_month(year, month, today, surface)
+        self.cache.put(key, surface)
+        return surface
+
+    def prefetch(self, year, month, today):
+        """
+        Queues the months around (year, month), nearest first.
+        -------------------------------------------------------
+        Replaces whatever was queued for the previously shown month.
+        """
+        self.prefetch_queue.clear()
+        for distance in range(1, self.prefetch_radius + 1):
+            for step in (distance, -distance):
+                self.prefetch_queue.append(add_months(year, month, step) + (today,))
+
+    def prefetch_step(self):
+        """
+        Renders the next queued month that is not cached yet.
+        -------------------------------------------------------
+        Called by the scene on idle frames.
+
+        Returns:
+            - True if a month was rendered, False if nothing was pending
+        """
+        while self.prefetch_queue:
+            year, month, today = self.prefetch_queue.popleft()
+            key = month_key(year, month, today)
+            if key in self.cache:
+                continue
+            start = time.perf_counter()
+            self.render(key, year, month, today)
+            self.prefetch_time += time.perf_counter() - start
+            self.prefetch_count += 1
+            self._prefetched.add(key)
+            return True
+        return False
+
+    def prefetch_stats(self):
+        """
+        Returns prefetch counters.
+        -------------------------------------------------------
+        Returns:
+            - dict with 'prefetched' (months rendered ahead), 'hits'
+              (of those, months later shown), 'hit_rate', 'time' (seconds
+              spent rendering ahead) and 'pending' (queued months)
+        """
+        rate = self.prefetch_hits / self.prefetch_count if self.prefetch_count else 0.0
+        return {'prefetched': self.prefetch_count, 'hits': self.prefetch_hits,
+                'hit_rate': rate, 'time': self.prefetch_time,
+                'pending': len(self.prefetch_queue)}
@@ -0,0 +1,125 @@
+"""
+engine.py
+-------------------------------------------------------
+Headless simulation core. Holds the game rules over a Player
+and the current date with no pygame dependency, so days can
+be simulated in tests and batch jobs without a display.
+Scene is a view on top of an Engine.
+
+Engine:
+    Game state (player + date) and the actions that change it.
+
+    - gather(self, resource):
+        Spends an action to gather a resource.
+
+    - build(self, building):
+        Spends an action and resources to construct a building.
+
+    - sleep(self):
+        Ends the day: advances the date, runs production and
+        restores actions.
+
+    - fast_forward(self, days):
+        Sleeps through several days in one closed-form step.
+
+    - reset(self, today=None):
+        Starts a new game.
+
+    - apply(self, entry):
+        Performs a journaled action dict (see save_load).
+"""
+
+# Standard Library Imports
+from datetime import datetime, timedelta
+
+# Third Party Imports
+
+# My Imports
+from player import Player
+
+
+class Engine:
+    """Game state and rules, independent of rendering."""
+
+    def __init__(self, today=None, player=None):
+        """
+        -------------------------------------------------------
+        Parameters:
+            - today : datetime the game starts on (defaults to now)
+            - player : Player to simulate (defaults to a new Player)
+
+        Attributes:
+            - player : Player holding resources, buildings and actions
+            - today : datetime of the current game day
+        """
+        self.player = player if player is not None else Player()
+        self.today = today if today is not None else datetime.today()
+
+    def gather(self, resource):
+        """
+        Spends one action to gather a resource.
+        -------------------------------------------------------
+        Returns:
+            - int amount gathered, 0 if no actions are left
+        """
+        return self.player.gather(resource)
+
+    def build(self, building):
+        """
+        Spends one action and the building's cost to construct it.
+        -------------------------------------------------------
+        Returns:
+            - True if the building was constructed, False otherwise
+        """
+        return self.player.build(building)
+
+    def sleep(self):
+        """
+        Ends the day: the date advances by one, every producing
+        building yields its resource and actions are restored.
+        """
+        self.fast_forward(1)
+
+    def fast_forward(self, days):
+        """
+        Sleeps through days in one step. Building counts do not
+        change while sleeping, so production is count * days and
+        the date moves by a single timedelta.
+        -------------------------------------------------------
+        Parameters:
+            - days : int >= 0, number of days to skip
+        """
+        if days < 0:
+            raise ValueError("Cannot fast-forward a negative number of days.")
+        if days == 0:
+            return
+        self.today += timedelta(days=days)
+        self.player.produce(days)
+        self.player.reset_actions()
+
+    def reset(self, today=None):
+        """
+        Starts a new game on today (defaults to now). The Player is
+        reset in place so anything holding a reference stays valid.
+        """
+        self.player.reset()
+        self.today = today if today is not None else datetime.today()
+
+    def apply(self, entry):
+        """
+        Performs a journaled action.
+        -------------------------------------------------------
+        Parameters:
+            - entry : dict with 'action' ('gather', 'build', 'sleep'
+              or 'reset') and its arguments ('resource', 'building',
+              'days' (sleep, defaults to 1) or 'date' as an ISO string)
+        """
+        action = entry['action']
+        if action == 'gather':
+            self.gather(entry['resource'])
+        elif action == 'build':
+            self.build(entry['building'])
+        elif action == 'sleep':
+            self.fast_forward(entry.get('days', 1))
+        elif action == 'reset':
+            self.reset(datetime.fromisoformat(entry['date']))
@@ -0,0 +1,207 @@
+"""
+env.py
+-------------------------------------------------------
+Gym-style environments over the colony rules for automated
+strategy search. Neither imports pygame.
+
+An action is an integer index into ACTIONS: one gather per
+resource, one build per building, then sleep. An observation
+holds the resources, the buildings (player.RESOURCES /
+player.BUILDINGS order) and the actions left. The reward is
+the change in score(): resources on hand plus the total cost
+of every building owned. An episode ends after max_days.
+
+ColonyEnv:
+    One colony on the pure-Python Engine.
+
+    - reset(self, out=None):
+        Starts a new episode and returns the first observation.
+
+    - step(self, action, out=None):
+        Performs one action; returns (obs, reward, done, info).
+
+VectorColonyEnv:
+    Many colonies stepped together on batch.ColonyBatch
+    (requires NumPy). Finished colonies reset automatically.
+
+    - reset(self, out=None):
+        Starts a new episode in every colony.
+
+    - step(self, actions, out=None):
+        Performs one action per colony; returns arrays of
+        (obs, rewards, dones, info).
+
+Both accept an optional out buffer (a list for ColonyEnv, an
+(N x OBSSIZE) array for VectorColonyEnv) that is filled in
+place and returned, so a search loop can reuse one buffer
+instead of allocating an observation every step.
+"""
+
+# Standard Library Imports
+
+# Third Party Imports
+try:
+    import numpy as np
+except ImportError:     # NumPy is optional; only VectorColonyEnv needs it
+    np = None
+
+# My Imports
+from engine import Engine
+from player import RESOURCES, BUILDINGS, COSTVECTORS
+
+ACTIONS = (tuple(('gather', name) for name in RESOURCES)
+           + tuple(('build', name) for name in BUILDINGS)
+           + (('sleep', None),))
+GATHER = 0                          # first gather action
+BUILD = len(RESOURCES)              # first build action
+SLEEP = len(ACTIONS) - 1
+OBSSIZE = len(RESOURCES) + len(BUILDINGS) + 1
+
+BUILDINGVALUE = tuple(sum(COSTVECTORS[name]) for name in BUILDINGS)
+
+
+def score(player):
+    """Resources on hand plus the total cost of every building owned."""
+    return (sum(player.resource_counts)
+            + sum(value * count for value, count in zip(BUILDINGVALUE, player.building_counts)))
+
+
+class ColonyEnv:
+    """
+    Single-colony environment on the pure-Python Engine.
+    -------------------------------------------------------
+    Attributes:
+        - engine : Engine being played
+        - max_days : episode length in days
+        - day : days slept through this episode
+    """
+
+    def __init__(self, max_days=100):
+        self.engine = Engine()
+        self.max_days = max_days
+        self.day = 0
+        self._score = 0
+
+    def observe(self, out=None):
+        """
+        Returns the current observation, filling out if given.
+        -------------------------------------------------------
+        Parameters:
+            - out : optional list of length OBSSIZE to fill in place
+        """
+        player = self.engine.player
+        if out is None:
+            out = [0] * OBSSIZE
+        out[:BUILD] = player.resource_counts
+        out[BUILD:SLEEP] = player.building_counts
+        out[-1] = player.actions_left
+        return out
+
+    def reset(self, out=None):
+        """Starts a new episode and returns the first observation."""
+        self.engine.reset()
+        self.day = 0
+        self._score = 0
+        return self.observe(out)
+
+    def step(self, action, out=None):
+        """
+        Performs one action.
+        -------------------------------------------------------
+        Parameters:
+            - action : int index into ACTIONS
+            - out : optional observation buffer (see observe)
+
+        Returns:
+            - (obs, reward, done, info); info['ok'] is False when the
+              action had no effect (no actions left, or unaffordable)
+        """
+        kind, name = ACTIONS[action]
+        engine = self.engine
+        if kind == 'gather':
+            ok = engine.gather(name) > 0
+        elif kind == 'build':
+            ok = engine.build(name)
+        else:
+            engine.sleep()
+            self.day += 1
+            ok = True
+
+        previous, self._score = self._score, score(engine.player)
+        return self.observe(out), self._score - previous, self.day >= self.max_days, {'ok': ok}
+
+
+class VectorColonyEnv:
+    """
+    Many colonies stepped with one call on batch.ColonyBatch.
+    -------------------------------------------------------
+    Attributes:
+        - batch : ColonyBatch holding every colony
+        - max_days : episode length in days
+    """
+
+    def __init__(self, count, max_days=100):
+        if np is None:
+            raise ImportError("VectorColonyEnv requires NumPy (pip install numpy).")
+        from batch import ColonyBatch, COSTS
+        self.batch = ColonyBatch(count)
+        self.max_days = max_days
+        self._values = COSTS.sum(axis=1)
+        self._score = np.zeros(count, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.batch)
+
+    def observe(self, out=None):
+        """
+        Returns the (N x OBSSIZE) observation array, filling out if given.
+        """
+        batch = self.batch
+        if out is None:
+            out = np.empty((len(batch), OBSSIZE), dtype=np.int64)
+        out[:, :BUILD] = batch.resources
+        out[:, BUILD:SLEEP] = batch.buildings
+        out[:, -1] = batch.actions_left
+        return out
+
+    def _scores(self):
+        return self.batch.resources.sum(axis=1) + self.batch.buildings @ self._values
+
+    def reset(self, out=None):
+        """Starts a new episode in every colony."""
+        self.batch.reset()
+        self._score[:] = 0
+        return self.observe(out)
+
+    def step(self, actions, out=None):
+        """
+        Performs one action per colony.
+        -------------------------------------------------------
+        Parameters:
+            - actions : (N,) int array of indices into ACTIONS
+            - out : optional (N x OBSSIZE) int64 buffer to fill
+
+        Returns:
+            - (obs, rewards, dones, info). Colonies that finish are
+              reset, and obs holds the first observation of their new
+              episode; info['ok'] marks actions that had an effect.
+        """
+        batch = self.batch
+        actions = np.asarray(actions)
+        gather = actions < BUILD
+        build = ~gather & (actions < SLEEP)
+        sleep = actions == SLEEP
+
+        ok = batch.gather(np.where(gather, actions, -1))
+        ok |= batch.build(np.where(build, actions - BUILD, -1))
+        batch.sleep(mask=sleep)
+        ok |= sleep
+
+        scores = self._scores()
+        rewards = scores - self._score
+        self._score = scores
+        dones = batch.days >= self.max_days
+        if dones.any():
+            batch.reset(dones)
+            self._score[dones] = 0
+        return self.observe(out), rewards, dones, {'ok': ok}
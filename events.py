@@ -3,8 +3,9 @@ events.py
 -------------------------------------------------------
 This file defines the EventHandler class, which handles all
 keyboard and mouse input for the game. It tracks events
-each frame and provides methods to check for key presses
-and mouse clicks.
+each frame, indexes them once into pressed keys, clicked
+buttons and the last mouse position, and provides O(1)
+methods to check for key presses and mouse clicks.
 
 
 Class:
@@ -13,10 +14,12 @@ Class:
 
 Methods:
     - __init__: Initializes the event queue.
-    - poll_events: Updates the event list from pygame.
+    - poll_events: Updates the event list from pygame, optionally
+      blocking until input arrives.
     - keydown: Checks if a specific key was pressed.
     - clicked: Checks if a specific mouse button was clicked.
     - clicked_any: Checks if any mouse button was clicked.
+    - click_pos: Position of a mouse button click this frame.
     - mouse_pos: Checks the mouse position
     - hovering: checks if mouse is hovering over a sprite
 """
@@ -25,6 +28,12 @@ import pygame
 
 class EventHandler:
     """Handles all input events for the game, including keyboard and mouse input."""
+    events = []
+    keys_down = set()   # keys pressed this frame
+    clicks = {}         # mouse button -> position clicked this frame
+    mouse = None        # last known mouse position
+    click_consumed = False
+
     def __init__() -> None:  
         """
         Initializes the EventHandler and fetches the initial
@@ -36,15 +45,54 @@ class EventHandler:
         EventHandler.events = pygame.event.get()
 
         
-    def poll_events():
+    def poll_events(timeout=None):
         """
         Refreshes the event queue from pygame.
         -------------------------------------------------------
+        Parameters:
+            - timeout : Optional int, milliseconds to block waiting
+              for the first event. None returns immediately.
+
         Called Each Frame:
             Must be called once per frame to update the current
             list of events.
         """
-        EventHandler.events = pygame.event.get()
+        if timeout is None:
+            events = pygame.event.get()
+        else:
+            event = pygame.event.wait(timeout)
+            if event.type == pygame.NOEVENT:
+                events = []
+            else:
+                events = [event] + pygame.event.get()
+        EventHandler.index_events(events)
+
+    def index_events(events):
+        """
+        Stores this frame's events and indexes them for O(1) queries.
+        -------------------------------------------------------
+        Parameters:
+            - events : list of pygame events for this frame
+        """
+        keys_down = set()
+        clicks = {}
+        mouse = EventHandler.mouse
+        if mouse is None:
+            mouse = pygame.mouse.get_pos()
+
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                mouse = event.pos
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                mouse = event.pos
+                clicks[event.button] = event.pos
+            elif event.type == pygame.KEYDOWN:
+                keys_down.add(event.key)
+
+        EventHandler.events = events
+        EventHandler.keys_down = keys_down
+        EventHandler.clicks = clicks
+        EventHandler.mouse = mouse
 
 
     def keydown(key):
@@ -58,11 +106,7 @@ class EventHandler:
             - True if the key was pressed this frame
             - False otherwise
         """
-        for event in EventHandler.events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == key:
-                    return True
-        return False
+        return key in EventHandler.keys_down
     
     def clicked(leftright = 1) -> bool:
         """
@@ -77,10 +121,7 @@ class EventHandler:
         """
         if EventHandler.click_consumed:
             return False
-        for event in EventHandler.events:
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == leftright:
-                    return True
+        return leftright in EventHandler.clicks
                 
     def clicked_any() -> bool:
         """
@@ -90,19 +131,32 @@ class EventHandler:
             - True if any mouse button was clicked this frame
             - False otherwise
         """
-        for event in EventHandler.events:
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                return True
-        return False
+        return bool(EventHandler.clicks)
+
+    def click_pos(leftright = 1):
+        """
+        Returns where a mouse button was clicked this frame.
+        -------------------------------------------------------
+        Parameters:
+            - leftright: 1 for left click, 3 for right click
+
+        Returns:
+            - (x, y) tuple from the click event
+            - None if the button was not clicked this frame
+        """
+        return EventHandler.clicks.get(leftright)
     
     def mouse_pos():
         """
         Returns the current mouse position.
         -------------------------------------------------------
+        Taken from the latest mouse event, so it costs no call
+        into SDL.
+
         Returns:
             - (x, y) tuple of mouse coordinates
         """
-        return pygame.mouse.get_pos()
+        return EventHandler.mouse
 
 
     def hovering(rect):
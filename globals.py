@@ -12,6 +12,13 @@ Screen:
     - SCREENWIDTH: Width of the game window in pixels.
     - SCREENHEIGHT: Height of the game window in pixels.
 
+Main Loop:
+    - FPS: Frame rate while the player is interacting.
+    - IDLEFRAMES: Quiet frames (no input, nothing redrawn) before the
+      loop stops ticking and blocks on the event queue.
+    - IDLETIMEOUT: Longest time in ms to block while idle, so timers
+      such as the clear save countdown are still serviced.
+
 Date Block:
     - DATEWIDTH: Width of each calendar date block.
     - DATEHEIGHT: Height of each calendar date block.
@@ -20,6 +27,11 @@ Calendar:
     - CALENDAROFFSETX: Horizontal offset of the calendar.
     - CALENDAROFFSETY: Vertical offset of the calendar.
     - MONTHBUTTONOFFSET: Spacing for month navigation buttons.
+    - MONTHTITLEY: Top of the month title; the calendar view spans
+      from here to the bottom of the screen.
+    - MONTHCACHESIZE: Number of pre-rendered months kept in memory.
+    - PREFETCHRADIUS: Months on each side of the displayed month that
+      are rendered ahead of time on idle frames.
 
 Resources:
     - RESOURCEPADDING: Padding between resource icons.
@@ -28,6 +40,18 @@ Resources:
     - RESOURCEOFFSETX: Horizontal offset for resource bar.
     - RESOURCEOFFSETY: Vertical offset for resource bar.
 
+Counters:
+    - COMPACTFROM: Resource and building counts at or above this are
+      shown compactly (12.3K, 1.2M).
+    - COUNTERCACHESIZE: Number of counter backgrounds (icon plus
+      label prefix at one position) kept in memory.
+    - GLYPHCACHESIZE: Number of rendered text pieces (label prefixes
+      and single characters per font and colour) kept in memory.
+
+Buildings:
+    - UNAFFORDABLESHADE: Brightness (0-255) that buildings the
+      player cannot afford are dimmed to.
+
 Build Menu:
     - BUILDMENUPADDING: Padding around build menu.
     - BUILDMENUWIDTH: Width of the build menu.
@@ -36,11 +60,36 @@ Build Menu:
     - BUILDMENUOFFSETY: Vertical offset of build menu.
     - OPTIONHEIGHT: Height of each build option.
     - OPTIONSPACING: Vertical spacing between build options.
+
+Tooltips:
+    - TOOLTIPCACHESIZE: Number of rendered tooltip surfaces kept in
+      memory, keyed by their text.
+
+Hints:
+    - HINTBUILDING: The hint (H key) suggests a step toward owning one
+      more of this building.
+    - HINTMAXSTATES: Planner expansions allowed per hint.
+    - HINTMAXSECONDS: Wall-clock seconds allowed per hint; past either
+      limit the hint falls back to the plan without helper buildings.
+
+Render Layers (drawn bottom to top):
+    - DATELAYER: Calendar date blocks.
+    - CALENDARLAYER: Month label, weekdays, month and sleep buttons.
+    - RESOURCELAYER: Resource bar.
+    - BUILDINGLAYER: Building bar.
+    - INTERACTIONLAYER: Clear save button.
+    - TOOLTIPLAYER: Hover tooltips.
+    - MENULAYER: Menus drawn over everything else.
 """
 
 SCREENWIDTH = 1280
 SCREENHEIGHT = 720
 
+# Main Loop
+FPS = 60
+IDLEFRAMES = 30
+IDLETIMEOUT = 250
+
 # Date Block
 DATEWIDTH = (SCREENWIDTH // 7) - 5
 DATEHEIGHT = SCREENHEIGHT / 10
@@ -49,6 +98,9 @@ DATEHEIGHT = SCREENHEIGHT / 10
 CALENDAROFFSETX = 18 // 2
 CALENDAROFFSETY = SCREENHEIGHT - (DATEHEIGHT + 4) * 6
 MONTHBUTTONOFFSET = 25
+MONTHTITLEY = int(CALENDAROFFSETY - DATEHEIGHT - 15)
+MONTHCACHESIZE = 12
+PREFETCHRADIUS = 2
 
 # Resources
 RESOURCEPADDING = 10
@@ -57,12 +109,18 @@ RESOURCEHEIGHT = 75
 RESOURCEOFFSETY = 5
 RESOURCEOFFSETX = 35 // 2
 
+# Counters
+COMPACTFROM = 10_000
+COUNTERCACHESIZE = 64
+GLYPHCACHESIZE = 256
+
 # Buildings
 BUILDINGPADDING = 10
 BUILDINGWIDTH = SCREENWIDTH // 7 - BUILDINGPADDING - 5
 BUILDINGHEIGHT = 50
 BUILDINGOFFSETX = 35 // 2
 BUILDINGOFFSETY = 5
+UNAFFORDABLESHADE = 160
 
 # BuildMenu
 BUILDMENUPADDING = 50
@@ -73,4 +131,19 @@ BUILDMENUOFFSETY = 25
 OPTIONHEIGHT = 75
 OPTIONSPACING = 10
 
+# Tooltips
+TOOLTIPCACHESIZE = 32
+
+# Hints
+HINTBUILDING = 'town_hall'
+HINTMAXSTATES = 20_000
+HINTMAXSECONDS = 0.03
 
+# Render Layers
+DATELAYER = 0
+CALENDARLAYER = 1
+RESOURCELAYER = 2
+BUILDINGLAYER = 3
+INTERACTIONLAYER = 4
+TOOLTIPLAYER = 5
+MENULAYER = 6
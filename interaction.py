@@ -1,46 +1,185 @@
 """
 interaction.py
-    check_interaction - Determines if a sprite is being interacted with by the player.
+    Target - An interactive sprite and the handlers attached to it.
+    InteractionDispatcher - Resolves the sprite under the cursor once per event
+        register - Attaches click/hover handlers to a sprite
+        invalidate - Marks the spatial index stale after targets move
+        block / unblock - Turns a modal blocker (e.g. the sleep button) on or off
+        target_at - Finds the topmost interactive sprite at a position
+        click - Calls the click handler of the sprite under a click
+        hover - Shows/hides hover handlers as the cursor moves between sprites
 """
 
 # Standard Library Imports
 
 # Third Party Imports
-import pygame
 
 # My Imports
-from events import EventHandler
 
-def check_interaction(sprite: pygame.sprite, scene) -> bool:
+
+class Target:
+    """An interactive sprite and the handlers attached to it."""
+
+    def __init__(self, sprite, order):
+        """
+        -------------------------------------------------------------
+        Parameters:
+            - sprite : pygame.sprite.Sprite that receives input
+            - order : int, registration order used to break layer ties
+        """
+        self.sprite = sprite
+        self.order = order
+        self.on_click = None
+        self.on_hover = None
+        self.on_leave = None
+        self.blocked_by = frozenset()
+
+
+class InteractionDispatcher:
     """
-    Checks whether a given sprite is being interacted with by the player.
-    Interaction is defined as a left mouse click while hovering over the sprite,
-    and only if no conflicting UI elements (like build menu or sleep button) are present.
+    Routes clicks and hovers to the single sprite under the cursor.
+    -------------------------------------------------------------
+    Interactive rects are bucketed into a uniform grid, so a lookup only
+    tests the few sprites sharing the cursor's cell. Sprites that sit on
+    higher render layers win over lower ones.
 
+    A target registered with blocked_by names ignores clicks while any
+    of those blockers is active (e.g. everything but the sleep button
+    while the player is out of actions).
     -------------------------------------------------------------
-    Parameters:
-        - sprite : pygame.sprite.Sprite
-            The sprite to check for interaction.
-        - scene : Scene object
-            The current scene containing UI elements and context.
-
-    Returns:
-        - bool : True if the sprite was clicked and interaction is allowed, else False
+    Attributes:
+        - targets : dict of sprite -> Target
+        - blockers : set of active blocker names
+        - hovered : Target currently under the cursor, or None
     """
-    if hasattr(scene, 'build_menu'):
-        return False
-    
-    if hasattr(scene, 'sleep_button'):
-        return False
-    
-    if not EventHandler.clicked_any():
-        return False
-    
-    mouse_pos = pygame.mouse.get_pos()
-    if not sprite.rect.collidepoint(mouse_pos):
-        return False
-    
-    if EventHandler.clicked(1):
+
+    CELLSIZE = 64
+
+    def __init__(self):
+        self.targets = {}
+        self.blockers = set()
+        self.hovered = None
+        self._grid = None
+        self._order = 0
+
+    def register(self, sprite, on_click=None, on_hover=None, on_leave=None, blocked_by=None):
+        """
+        Attaches handlers to a sprite. Calling it again for the same
+        sprite updates only the handlers that are passed.
+        -------------------------------------------------------------
+        Parameters:
+            - sprite : sprite whose rect receives input
+            - on_click : callable() run when the sprite is left clicked
+            - on_hover : callable(mouse_pos) run while hovering the sprite
+            - on_leave : callable() run when the cursor leaves the sprite
+            - blocked_by : iterable of blocker names that disable clicks
+        """
+        target = self.targets.get(sprite)
+        if target is None:
+            target = Target(sprite, self._order)
+            self._order += 1
+            self.targets[sprite] = target
+            self._grid = None
+
+        if on_click is not None:
+            target.on_click = on_click
+        if on_hover is not None:
+            target.on_hover = on_hover
+        if on_leave is not None:
+            target.on_leave = on_leave
+        if blocked_by is not None:
+            target.blocked_by = frozenset(blocked_by)
+
+    def invalidate(self):
+        """Rebuilds the spatial index on the next lookup (call after moving a target)."""
+        self._grid = None
+
+    def unregister(self, sprite):
+        """Removes a sprite from the dispatcher."""
+        if self.targets.pop(sprite, None) is not None:
+            self._grid = None
+
+    def block(self, name):
+        """Activates a modal blocker."""
+        self.blockers.add(name)
+
+    def unblock(self, name):
+        """Deactivates a modal blocker."""
+        self.blockers.discard(name)
+
+    def is_blocked(self, target):
+        """Returns True if any of the target's blockers is active."""
+        return not target.blocked_by.isdisjoint(self.blockers)
+
+    def _build_grid(self):
+        """
+        Buckets every live target's rect into grid cells. Dead sprites
+        (killed since registration) are dropped here.
+        """
+        for sprite in [sprite for sprite in self.targets if not sprite.alive()]:
+            del self.targets[sprite]
+
+        ordered = sorted(self.targets.values(),
+                         key=lambda target: (target.sprite.layer, target.order),
+                         reverse=True)
+        grid = {}
+        size = self.CELLSIZE
+        for target in ordered:
+            rect = target.sprite.rect
+            for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+                for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                    grid.setdefault((cx, cy), []).append(target)
+        self._grid = grid
+
+    def target_at(self, pos, handler):
+        """
+        Finds the topmost live target at pos that has the given handler.
+        -------------------------------------------------------------
+        Parameters:
+            - pos : (x, y) screen position
+            - handler : 'on_click' or 'on_hover'
+
+        Returns:
+            - Target or None
+        """
+        if self._grid is None:
+            self._build_grid()
+
+        size = self.CELLSIZE
+        for target in self._grid.get((pos[0] // size, pos[1] // size), ()):
+            if getattr(target, handler) is None:
+                continue
+            sprite = target.sprite
+            if sprite.alive() and sprite.rect.collidepoint(pos):
+                return target
+            if not sprite.alive():
+                self._grid = None
+        return None
+
+    def click(self, pos):
+        """
+        Dispatches a left click to the sprite under pos.
+        -------------------------------------------------------------
+        Returns:
+            - True if a handler ran, False if nothing (or only a blocked
+              sprite) was under the click
+        """
+        target = self.target_at(pos, 'on_click')
+        if target is None or self.is_blocked(target):
+            return False
+        target.on_click()
         return True
-    
-    return False
+
+    def hover(self, pos):
+        """
+        Updates hover state for the cursor at pos. The previously hovered
+        sprite gets on_leave when the cursor moves off it; the sprite under
+        the cursor gets on_hover.
+        """
+        target = self.target_at(pos, 'on_hover')
+        if target is not self.hovered:
+            if self.hovered is not None and self.hovered.on_leave is not None:
+                self.hovered.on_leave()
+            self.hovered = target
+        if target is not None:
+            target.on_hover(pos)
@@ -4,7 +4,14 @@ buttons_tooltip.py
         __init__ - Initializes the sleep button with optional text and image
     Tooltip - Tooltip sprite for displaying dynamic or static text over a resource/building icon
         __init__ - Sets up the tooltip with the associated icon, text, and player reference
-        update - Updates tooltip visibility, position, and text each frame
+        show - Positions the tooltip near the mouse, re-rendering if the player changed
+        render - Sets the image for the current text from the shared surface cache
+        render_text - Draws a tooltip surface for a text
+        hide - Hides the tooltip when the mouse leaves its icon
+    ClearSave - Button that clears the save after several confirming clicks
+    HintLabel - Box showing the planner's suggested next action
+        show - Renders the hint text
+        hide - Hides the hint
 """
 
 # Standard Library Imports
@@ -15,14 +22,16 @@ import pygame
 
 # My Imports
 from sprites import Entity
+from cache import LRUCache
 from tooltip import TOOLTIPS
 from globals import *
-from interaction import check_interaction
 from save_load import clear_save
+from assets import load_image, load_font
 
 
 class SleepButton(Entity):
     """Button to end the day and reset player actions."""
+    _layer = CALENDARLAYER
 
     def __init__(self, groups, image=None, name='sleep', text='Sleep', position=(0, 0), font_size=32):
         """
@@ -39,7 +48,7 @@ class SleepButton(Entity):
             - position : tuple(int, int), center position on screen
             - font_size : int, font size for rendering text
         """
-        font = pygame.font.SysFont(None, font_size)
+        font = load_font(None, font_size)
         text_surf = font.render(name.capitalize(), True, 'black')
         width, height = text_surf.get_size()
 
@@ -64,10 +73,19 @@ class Tooltip(Entity):
         - text : either a string or a callable returning a string (for dynamic text)
         - player : reference to Player object (used if text is a callable)
         - font : pygame.font.Font instance for rendering text
+        - title_font : bold pygame.font.Font for the first line
+        - version : Player.version the image was rendered at; the text is
+          only re-rendered after the player's state changed
         - visible : bool indicating if tooltip is currently visible
+
+    Class Attributes:
+        - cache : LRUCache of text -> rendered surface, shared by every
+          tooltip (the fonts and colours are the same for all of them)
     """
 
+    _layer = TOOLTIPLAYER
     PADDING = 6
+    cache = LRUCache(TOOLTIPCACHESIZE)
 
     def __init__(self, groups, icon, text, player):
         """
@@ -82,67 +100,104 @@ class Tooltip(Entity):
         self.icon = icon
         self.text = text
         self.player = player
-        self.font = pygame.font.SysFont(None, 24)
-        self.visible = False
+        self.font = load_font(None, 24)
+        self.title_font = load_font(None, 24, bold=True)
+        self.version = None
 
-        image = pygame.Surface((1, 1), pygame.SRCALPHA)  # placeholder, updated in update()
+        image = pygame.Surface((1, 1), pygame.SRCALPHA)  # placeholder, updated in show()
         super().__init__(groups, image=image, position=(0, 0))
+        self.visible = False
 
-    def update(self):
+    def show(self, mouse_pos):
         """
-        Updates the tooltip each frame.
-        Checks if the mouse is hovering over the associated icon,
-        updates text content, resizes the tooltip image, and positions it near the mouse.
+        Updates text content, resizes the tooltip image, and positions it near the mouse.
         -------------------------------------------------------------
-        Called each frame via Scene.update().
-        """
-        mouse_pos = pygame.mouse.get_pos()
-        if self.icon.rect.collidepoint(mouse_pos):
-            display_text = self.text(self.player) if callable(self.text) else self.text
-            lines = display_text.split('\n')
-
-            # Calculate width and height
-            line_height = self.font.get_height()
-            width = max(self.font.size(line)[0] for line in lines) + self.PADDING * 2
-            height = len(lines) * line_height + (len(lines) - 1) * 4 + self.PADDING * 2
-
-            # Create image
-            self.image = pygame.Surface((width, height), pygame.SRCALPHA)
-            self.image.fill('black')  # background
-            pygame.draw.rect(self.image, 'white', self.image.get_rect(), 2)  # border
-
-            tip_title_font = pygame.font.SysFont(None, 24, bold=True)
-            y_offset = self.PADDING
-            for i, line in enumerate(lines):
-                font = tip_title_font if i == 0 else self.font
-                color = 'lightskyblue' if i == 0 else 'white'
-                text_surf = font.render(line, True, color)
-                self.image.blit(text_surf, (self.PADDING, y_offset))
-                y_offset += line_height + 4
-
-            # Position tooltip near mouse
-            self.rect = self.image.get_rect(topleft=(mouse_pos[0] + 12, mouse_pos[1] + 12))
-            if self.rect.right > SCREENWIDTH:
-                self.rect = self.image.get_rect(topright=(mouse_pos[0] - 12, mouse_pos[1] + 12))
+        Called by Scene.dispatcher while the mouse hovers the associated icon.
+        The text is only re-rendered when the player's version changed
+        since the last render; otherwise the tooltip just moves.
+
+        Parameters:
+            - mouse_pos : (x, y) current mouse position
+        """
+        if self.version != self.player.version:
+            self.version = self.player.version
+            self.render()
+
+        # Position tooltip near mouse
+        self.rect = self.image.get_rect(topleft=(mouse_pos[0] + 12, mouse_pos[1] + 12))
+        if self.rect.right > SCREENWIDTH:
+            self.rect = self.image.get_rect(topright=(mouse_pos[0] - 12, mouse_pos[1] + 12))
+        if not self.visible:
             self.visible = True
-        else:
+
+    def render(self):
+        """
+        Sets the image for the current text.
+        -------------------------------------------------------------
+        Surfaces are cached by text, so text seen before (the same counts
+        again, or another tooltip with identical text) costs a lookup.
+        """
+        display_text = self.text(self.player) if callable(self.text) else self.text
+        image = self.cache.get(display_text)
+        if image is None:
+            image = self.render_text(display_text)
+            self.cache.put(display_text, image)
+        self.image = image
+
+    def render_text(self, display_text):
+        """
+        Draws a tooltip surface for a text.
+        -------------------------------------------------------------
+        Parameters:
+            - display_text : str, lines separated by newlines; the first
+              line is drawn as a title
+
+        Returns:
+            - pygame.Surface
+        """
+        lines = display_text.split('\n')
+
+        # Calculate width and height
+        line_height = self.font.get_height()
+        width = max(self.font.size(line)[0] for line in lines) + self.PADDING * 2
+        height = len(lines) * line_height + (len(lines) - 1) * 4 + self.PADDING * 2
+
+        # Create image
+        image = pygame.Surface((width, height), pygame.SRCALPHA)
+        image.fill('black')  # background
+        pygame.draw.rect(image, 'white', image.get_rect(), 2)  # border
+
+        y_offset = self.PADDING
+        for i, line in enumerate(lines):
+            font = self.title_font if i == 0 else self.font
+            color = 'lightskyblue' if i == 0 else 'white'
+            text_surf = font.render(line, True, color)
+            image.blit(text_surf, (self.PADDING, y_offset))
+            y_offset += line_height + 4
+        return image
+
+    def hide(self):
+        """
+        Hides the tooltip.
+        -------------------------------------------------------------
+        Called by Scene.dispatcher when the mouse leaves the associated icon.
+        """
+        if self.visible:
             self.visible = False
-            self.rect.topleft = (-999, -999)
 
-class ClearSave(pygame.sprite.Sprite):
+class ClearSave(Entity):
+    _layer = INTERACTIONLAYER
+
     def __init__(self, groups, scene, position):
-        super().__init__(groups)
         self.scene = scene
         self.position = position
         self.countdown = 5   # 5 clicks required
-        self.font = pygame.font.SysFont(None, 18)
+        self.font = load_font(None, 18)
         self.last_click_time = None
 
         # Base image
-        self.base_image = pygame.image.load("res/clear_save.png").convert_alpha()
-        self.base_image = pygame.transform.scale(self.base_image, (BUILDINGWIDTH, BUILDINGHEIGHT))
-        self.image = self.base_image.copy()
-        self.rect = self.image.get_rect(topleft=position)
+        self.base_image = load_image("res/clear_save.png", (BUILDINGWIDTH, BUILDINGHEIGHT))
+        super().__init__(groups, self.base_image.copy(), position)
 
         self.update_text()
 
@@ -165,20 +220,23 @@ class ClearSave(pygame.sprite.Sprite):
             self.image.blit(surf, (x, y_offset))
             y_offset += surf.get_height()
 
+    def update(self):
+        """Resets the countdown once the player stops clicking."""
+        self.check_time_since_click()
+
     def on_click(self):
-        """Called when user clicks the button."""
+        """Called by Scene.dispatcher when user clicks the button."""
         self.check_time_since_click()
-        if check_interaction(self, self.scene):
-            self.last_click_time = time.time()
-            if self.countdown > 2:
-                self.countdown -= 1
-                self.update_text()
-            elif self.countdown == 2:
-                self.countdown -= 1
-                self.update_text(confirmation=True)
-            else:
-                # LAST CLICK → perform reset
-                self.clear_save_and_reload()
+        self.last_click_time = time.time()
+        if self.countdown > 2:
+            self.countdown -= 1
+            self.update_text()
+        elif self.countdown == 2:
+            self.countdown -= 1
+            self.update_text(confirmation=True)
+        else:
+            # LAST CLICK → perform reset
+            self.clear_save_and_reload()
 
     def clear_save_and_reload(self):
         # Clear save file
@@ -197,3 +255,45 @@ class ClearSave(pygame.sprite.Sprite):
             self.update_text()
 
 
+class HintLabel(Entity):
+    """Box showing the build-order planner's suggested next action."""
+    _layer = TOOLTIPLAYER
+    PADDING = 6
+
+    def __init__(self, groups, position=(0, 0)):
+        """
+        Initializes a hidden HintLabel.
+        -------------------------------------------------------------
+        Parameters:
+            - groups : list of pygame.sprite.Group to add this sprite to
+            - position : (x, y) top-right corner of the box
+        """
+        self.font = load_font(None, 24)
+        self.anchor = position
+        image = pygame.Surface((1, 1), pygame.SRCALPHA)  # placeholder, updated in show()
+        super().__init__(groups, image=image, position=position)
+        self.visible = False
+
+    def show(self, text):
+        """
+        Renders text in a bordered box and makes the hint visible.
+        -------------------------------------------------------------
+        Parameters:
+            - text : str, hint to display
+        """
+        text_surf = self.font.render(text, True, 'white')
+        width, height = text_surf.get_size()
+        image = pygame.Surface((width + self.PADDING * 2, height + self.PADDING * 2))
+        image.fill('black')
+        pygame.draw.rect(image, 'lightskyblue', image.get_rect(), 2)
+        image.blit(text_surf, (self.PADDING, self.PADDING))
+
+        self.image = image
+        self.rect = image.get_rect(topright=self.anchor)
+        if not self.visible:
+            self.visible = True
+
+    def hide(self):
+        """Hides the hint."""
+        if self.visible:
+            self.visible = False
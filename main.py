@@ -3,6 +3,7 @@ import sys
 
 from scene import Scene
 from events import EventHandler
+from save_load import flush_saves
 from globals import *
 
 class Calendar:
@@ -11,27 +12,40 @@ class Calendar:
         self.screen = pygame.display.set_mode((SCREENWIDTH, SCREENHEIGHT))
         self.clock = pygame.time.Clock()
         self.running = True
+        self.idle_frames = 0
         self.scene = Scene(self)
 
     def run(self):
         while self.running:
             self.update()
             self.draw()
+        self.close()
 
     def update(self):
-        EventHandler.poll_events()
+        # After IDLEFRAMES quiet frames, block until input or the timeout
+        if self.idle_frames >= IDLEFRAMES:
+            EventHandler.poll_events(IDLETIMEOUT)
+        else:
+            EventHandler.poll_events()
+            self.clock.tick(FPS)
+
         for event in EventHandler.events:
             if event.type == pygame.QUIT:
                 self.running = False
-        
-        self.clock.tick(60)
+
         self.scene.update()
-        pygame.display.update()
 
     def draw(self):
-        self.scene.draw()
+        dirty_rects = self.scene.draw()
+        pygame.display.update(dirty_rects)
+
+        if EventHandler.events or dirty_rects or self.scene.has_pending_work():
+            self.idle_frames = 0
+        else:
+            self.idle_frames += 1
 
     def close(self):
+        flush_saves()
         pygame.quit()
         sys.exit()
 
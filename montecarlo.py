@@ -0,0 +1,223 @@
+"""
+montecarlo.py
+-------------------------------------------------------
+Plays out many games in parallel with the headless Engine and
+aggregates statistics for strategy and balance evaluation.
+
+Games are split into chunks and handed to a
+ProcessPoolExecutor. Every game draws from its own RNG seeded
+from (seed, game index), and per-chunk statistics are plain
+sums, so the result is identical for any worker count or chunk
+size.
+
+POLICIES:
+    Named policies, policy(engine, rng) -> action tuple.
+
+play(policy, days, rng):
+    Plays one game and returns its statistics.
+
+run(games, days, policy='random', seed=0, workers=None, chunks=None):
+    Plays games across a process pool and summarises them.
+
+Run from the command line:
+    python montecarlo.py --games 10000 --days 60 --policy greedy
+"""
+
+# Standard Library Imports
+import argparse
+import os
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+# Third Party Imports
+
+# My Imports
+from engine import Engine
+from player import RESOURCES, BUILDINGS, COSTVECTORS
+
+STARTDATE = datetime(2025, 1, 1)
+PRIORITY = ('town_hall', 'house', 'farm', 'lumber_yard', 'quarry', 'gold_mine', 'iron_mine')
+TOWNHALLCOST = COSTVECTORS['town_hall']
+
+
+def random_policy(engine, rng):
+    """Gathers any resource or builds any affordable building, uniformly."""
+    player = engine.player
+    choices = [('gather', name) for name in RESOURCES]
+    choices += [('build', name) for name in BUILDINGS if player.can_afford(COSTVECTORS[name])]
+    return rng.choice(choices)
+
+
+def greedy_policy(engine, rng):
+    """
+    Saves up for town halls. Builds a town hall when affordable;
+    otherwise builds the first other building in PRIORITY order that
+    can be paid from surplus alone (it leaves at least a town hall's
+    worth of every resource it spends), otherwise gathers the
+    resource a town hall is shortest of, breaking ties with rng so
+    games differ.
+    """
+    player = engine.player
+    have = player.resource_counts
+    if player.can_afford(TOWNHALLCOST):
+        return ('build', 'town_hall')
+    for name in PRIORITY[1:]:
+        if all(stock - need >= reserve
+               for stock, need, reserve in zip(have, COSTVECTORS[name], TOWNHALLCOST) if need):
+            return ('build', name)
+    shortfall = [need - stock for need, stock in zip(TOWNHALLCOST, have)]
+    most = max(shortfall)
+    return ('gather', rng.choice([name for name, short in zip(RESOURCES, shortfall) if short == most]))
+
+
+POLICIES = {
+    'random': random_policy,
+    'greedy': greedy_policy,
+}
+
+
+def play(policy, days, rng):
+    """
+    Plays one game of days days.
+    -------------------------------------------------------
+    Parameters:
+        - policy : callable(engine, rng) -> ('gather', resource),
+          ('build', building) or ('sleep', None)
+        - days : days to play
+        - rng : random.Random used by the policy
+
+    Returns:
+        - (curve, first_town_hall, buildings): resources held at the
+          start of each day and at the end (days + 1 rows), the day
+          the first town hall was built (None if never), and the
+          final building counts in BUILDINGS order
+    """
+    engine = Engine(STARTDATE)
+    player = engine.player
+    curve = []
+    first_town_hall = None
+    for day in range(days):
+        curve.append(tuple(player.resource_counts))
+        while player.actions_left > 0:
+            kind, name = policy(engine, rng)
+            if kind == 'sleep':
+                break
+            if kind == 'gather':
+                engine.gather(name)
+            elif not engine.build(name):
+                break           # an unaffordable build ends the day
+            elif name == 'town_hall' and first_town_hall is None:
+                first_town_hall = day
+        engine.sleep()
+    curve.append(tuple(player.resource_counts))
+    return curve, first_town_hall, tuple(player.building_counts)
+
+
+def _play_chunk(job):
+    """
+    Worker: plays games [start, stop) and returns summed statistics.
+    -------------------------------------------------------
+    Returns:
+        - (curve_sums, first_town_halls, building_sums) where
+          first_town_halls lists (game index, day) pairs
+    """
+    start, stop, seed, days, policy_name = job
+    policy = POLICIES[policy_name]
+    curve_sums = [[0] * len(RESOURCES) for _ in range(days + 1)]
+    building_sums = [0] * len(BUILDINGS)
+    first_town_halls = []
+    for game in range(start, stop):
+        curve, first_town_hall, buildings = play(policy, days, random.Random(f"{seed}:{game}"))
+        for sums, row in zip(curve_sums, curve):
+            for r, value in enumerate(row):
+                sums[r] += value
+        for b, count in enumerate(buildings):
+            building_sums[b] += count
+        if first_town_hall is not None:
+            first_town_halls.append((game, first_town_hall))
+    return curve_sums, first_town_halls, building_sums
+
+
+def run(games, days, policy='random', seed=0, workers=None, chunks=None):
+    """
+    Plays games in parallel and summarises them.
+    -------------------------------------------------------
+    Parameters:
+        - games : number of games to play
+        - days : days per game
+        - policy : name of a policy in POLICIES
+        - seed : base seed; the same seed gives the same summary
+        - workers : processes to use (defaults to every core; 1 plays
+          in this process)
+        - chunks : number of work chunks (defaults to 4 per worker)
+
+    Returns:
+        - dict with
+            * 'games', 'days', 'policy', 'seed'
+            * 'resource_curve' : {resource: mean amount held on each day}
+            * 'first_town_hall' : {'reached': fraction of games,
+              'mean' / 'median' : day among games that built one}
+            * 'building_mix' : {building: mean count at the end}
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy {policy!r}; choose from {sorted(POLICIES)}")
+    if games < 1:
+        raise ValueError(f"games must be at least 1, got {games}")
+    workers = workers or os.cpu_count() or 1
+    chunks = max(1, min(games, chunks or workers * 4))
+    bounds = [games * i // chunks for i in range(chunks + 1)]
+    jobs = [(bounds[i], bounds[i + 1], seed, days, policy) for i in range(chunks)]
+
+    if workers == 1:
+        results = list(map(_play_chunk, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_play_chunk, jobs))
+
+    curve_sums = [[0] * len(RESOURCES) for _ in range(days + 1)]
+    building_sums = [0] * len(BUILDINGS)
+    first_town_halls = []
+    for chunk_curve, chunk_firsts, chunk_buildings in results:
+        for sums, row in zip(curve_sums, chunk_curve):
+            for r, value in enumerate(row):
+                sums[r] += value
+        for b, count in enumerate(chunk_buildings):
+            building_sums[b] += count
+        first_town_halls.extend(chunk_firsts)
+
+    first_days = [day for _, day in sorted(first_town_halls)]
+    return {
+        'games': games,
+        'days': days,
+        'policy': policy,
+        'seed': seed,
+        'resource_curve': {name: [sums[r] / games for sums in curve_sums]
+                           for r, name in enumerate(RESOURCES)},
+        'first_town_hall': {
+            'reached': len(first_days) / games,
+            'mean': statistics.fmean(first_days) if first_days else None,
+            'median': statistics.median(first_days) if first_days else None,
+        },
+        'building_mix': {name: building_sums[b] / games for b, name in enumerate(BUILDINGS)},
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Monte Carlo strategy evaluation.")
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--days', type=int, default=60)
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='random')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    summary = run(args.games, args.days, args.policy, args.seed, args.workers)
+    first = summary['first_town_hall']
+    print(f"{args.games} games x {args.days} days, policy {args.policy}, seed {args.seed}")
+    print(f"First town hall: {first['reached']:.0%} of games, "
+          f"mean day {first['mean']}, median day {first['median']}")
+    print("Final resources:", {name: round(curve[-1], 1)
+                               for name, curve in summary['resource_curve'].items()})
+    print("Building mix:", {name: round(count, 2) for name, count in summary['building_mix'].items()})
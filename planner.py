@@ -0,0 +1,299 @@
+"""
+planner.py
+-------------------------------------------------------
+Build-order planner: finds a sequence of gather, build and
+sleep actions that reaches a goal (e.g. {'town_hall': 3}) in
+few days, using the game rules as player.py tabulates them
+(COSTMATRIX, the house gather bonus, the town-hall action
+bonus and daily production from YIELDPAIRS).
+
+The search runs over build orders. Each step picks the next
+building and plays it out just in time: gather the resource
+with the largest shortfall until the building is affordable,
+sleeping whenever actions run out, then build. Every action
+is spent on progress, so only the order of buildings is
+searched.
+
+States are expanded in order of (day, actions used) from a
+heap (Dijkstra), so the first state meeting the goal has the
+fewest days among the plans searched. Three things keep the
+search to seconds:
+
+    - a transposition table keyed by the buildings owned (a
+      multiset, so orders reaching the same buildings merge)
+      holding the (day, actions left, resources) already
+      reached with them; a state that is no earlier, has no
+      more actions and no more of any resource than one of
+      those is dominated and pruned.
+    - only buildings that can matter are considered: the goal
+      buildings, houses, town halls, and producers of a
+      resource some of those cost.
+    - a helper (a building beyond the goal) is only built while
+      it can still pay for itself: its cost in resources and in
+      the action spent building it must be outweighed by what
+      it adds per day until the finish day of the plan that
+      builds the goal with no helpers at all.
+
+The plans are near-minimal, not guaranteed optimal: gathering
+always follows the largest shortfall rather than being searched,
+and payback pruning is a heuristic that can discard a helper
+which would have paid off.
+
+In-game hints cannot wait seconds for a deep goal, so plan() also
+takes a wall-clock budget (max_seconds). When the search runs out
+of states or time it returns None, or with fallback=True the
+helper-free plan used as the upper bound.
+
+Plan:
+    Result of a search (actions, days, states expanded).
+
+plan(player, goal, max_days=PLANMAXDAYS, max_states=PLANMAXSTATES,
+     max_seconds=None, fallback=False):
+    Finds a near-minimum-day plan from a Player's state.
+
+next_step(player, goal, max_states=PLANMAXSTATES, max_seconds=None):
+    Describes the first action of a plan, for in-game hints.
+"""
+
+# Standard Library Imports
+import heapq
+import time
+from collections import namedtuple
+
+# Third Party Imports
+
+# My Imports
+from player import RESOURCES, BUILDINGS, COSTMATRIX, YIELDPAIRS, HOUSE, TOWNHALL
+
+PLANMAXDAYS = 120
+PLANMAXSTATES = 200_000
+# expansions between wall-clock checks when plan() has max_seconds
+_CLOCKEVERY = 32
+
+_NR, _NB = len(RESOURCES), len(BUILDINGS)
+# resource index each building yields, -1 for none
+_YIELD = tuple(dict(YIELDPAIRS).get(b, -1) for b in range(_NB))
+
+Plan = namedtuple('Plan', ('actions', 'days', 'expanded'))
+Plan.__doc__ = """
+Result of a search.
+-------------------------------------------------------
+    - actions : list of ('gather', resource), ('build', building)
+      and ('sleep', None) tuples in order
+    - days : number of sleeps in the plan
+    - expanded : states expanded by the search
+"""
+
+
+def _candidates(goal_counts):
+    """Indices of buildings worth considering for a goal."""
+    wanted = {b for b in range(_NB) if goal_counts[b] > 0} | {HOUSE, TOWNHALL}
+    needed = {r for b in wanted for r in range(_NR) if COSTMATRIX[b][r] > 0}
+    producers = {b for b in range(_NB) if _YIELD[b] in needed}
+    return sorted(wanted | producers)
+
+
+def _build_next(resources, buildings, actions_left, day, b, max_days):
+    """
+    Plays out "build b next": gathers the largest shortfall until b
+    is affordable, sleeping when out of actions, then builds it.
+    -------------------------------------------------------
+    Returns:
+        - (resources, buildings, actions_left, day, actions) after
+          building, or None if it cannot finish by max_days
+    """
+    resources = list(resources)
+    cost = COSTMATRIX[b]
+    amount = 1 + buildings[HOUSE]
+    actions = []
+    while True:
+        if actions_left == 0:
+            if day >= max_days:
+                return None
+            for producer, r in enumerate(_YIELD):
+                if r >= 0:
+                    resources[r] += buildings[producer]
+            actions_left = 3 + buildings[TOWNHALL]
+            day += 1
+            actions.append(('sleep', None))
+            continue
+        shortfall = [need - have for have, need in zip(resources, cost)]
+        r = max(range(_NR), key=shortfall.__getitem__)
+        if shortfall[r] <= 0:
+            break
+        resources[r] += amount
+        actions_left -= 1
+        actions.append(('gather', RESOURCES[r]))
+
+    for r in range(_NR):
+        resources[r] -= cost[r]
+    buildings = buildings[:b] + (buildings[b] + 1,) + buildings[b + 1:]
+    actions.append(('build', BUILDINGS[b]))
+    return tuple(resources), buildings, actions_left - 1, day, actions
+
+
+def _greedy_plan(resources, buildings, actions_left, goal_counts, max_days):
+    """
+    Builds the goal in BUILDINGS order with no helpers (an upper bound).
+    -------------------------------------------------------
+    Returns:
+        - (finish day, actions), or (max_days, None) if it cannot
+          finish by max_days
+    """
+    day = 0
+    taken = []
+    for b in range(_NB):
+        for _ in range(max(goal_counts[b] - buildings[b], 0)):
+            step = _build_next(resources, buildings, actions_left, day, b, max_days)
+            if step is None:
+                return max_days, None
+            resources, buildings, actions_left, day, actions = step
+            taken += actions
+    return day, taken
+
+
+def _missing(resources, buildings, days_left, goal_counts):
+    """
+    Units of each resource the goal still needs beyond current stock
+    and what current producers yield over days_left (may be negative).
+    """
+    missing = [-have for have in resources]
+    for g in range(_NB):
+        count = goal_counts[g] - buildings[g]
+        if count > 0:
+            for r, units in enumerate(COSTMATRIX[g]):
+                missing[r] += units * count
+    for producer, r in enumerate(_YIELD):
+        if r >= 0:
+            missing[r] -= buildings[producer] * days_left
+    return missing
+
+
+def _pays_back(b, missing, buildings, actions_left, days_left):
+    """
+    True if helper b still returns more than it costs in the days
+    left. Resources count as units and an action as the units one
+    gather yields; output beyond what the goal is missing is worth
+    nothing.
+    """
+    per_gather = 1 + buildings[HOUSE]
+    cost = sum(COSTMATRIX[b]) + per_gather
+    if b == HOUSE:
+        gain = min(actions_left + days_left * (3 + buildings[TOWNHALL]),
+                   sum(units for units in missing if units > 0))
+    elif b == TOWNHALL:
+        gain = min(days_left * per_gather, sum(units for units in missing if units > 0))
+    else:
+        gain = min(days_left, missing[_YIELD[b]])
+    return gain > cost
+
+
+def _dominated(front, day, actions_left, resources):
+    """True if an entry of front is no later, no poorer in actions and resources."""
+    for other_day, other_actions, other_resources in front:
+        if ((other_day, -other_actions) <= (day, -actions_left)
+                and all(a >= b for a, b in zip(other_resources, resources))):
+            return True
+    return False
+
+
+def plan(player, goal, max_days=PLANMAXDAYS, max_states=PLANMAXSTATES,
+         max_seconds=None, fallback=False):
+    """
+    Finds a near-minimum-day sequence of actions reaching goal
+    (see the module docstring for what the search leaves out).
+    -------------------------------------------------------
+    Parameters:
+        - player : Player (or anything with resources, buildings and
+          actions_left) to plan from
+        - goal : dict of building name -> count to own
+        - max_days : days after which the search gives up
+        - max_states : expansions after which the search gives up
+        - max_seconds : wall-clock seconds after which the search
+          gives up, or None for no time limit
+        - fallback : if True, a search that gives up returns the
+          helper-free plan instead of None (when one exists)
+
+    Returns:
+        - Plan, or None if no plan was found within the limits
+    """
+    goal_counts = tuple(goal.get(name, 0) for name in BUILDINGS)
+    resources = tuple(player.resources[name] for name in RESOURCES)
+    buildings = tuple(player.buildings[name] for name in BUILDINGS)
+    candidates = _candidates(goal_counts)
+    finish, greedy = _greedy_plan(resources, buildings, player.actions_left,
+                                  goal_counts, max_days)
+    deadline = None if max_seconds is None else time.perf_counter() + max_seconds
+
+    # heap entries: (day, -actions_left, tiebreak, resources, buildings, node)
+    # node: (parent node, actions taken to get here)
+    start = (None, [])
+    heap = [(0, -player.actions_left, 0, resources, buildings, start)]
+    table = {}
+    counter = 1
+    expanded = 0
+
+    while heap:
+        day, neg_actions, _, resources, buildings, node = heapq.heappop(heap)
+        actions_left = -neg_actions
+        if all(have >= want for have, want in zip(buildings, goal_counts)):
+            return Plan(_unwind(node), day, expanded)
+
+        front = table.setdefault(buildings, [])
+        if _dominated(front, day, actions_left, resources):
+            continue
+        front.append((day, actions_left, resources))
+        expanded += 1
+        if expanded > max_states or (
+                deadline is not None and expanded % _CLOCKEVERY == 0
+                and time.perf_counter() > deadline):
+            break
+
+        missing = _missing(resources, buildings, finish - day, goal_counts)
+        for b in candidates:
+            if (buildings[b] >= goal_counts[b]
+                    and not _pays_back(b, missing, buildings, actions_left, finish - day)):
+                continue
+            step = _build_next(resources, buildings, actions_left, day, b, finish)
+            if step is None:
+                continue
+            after, built, left, when, actions = step
+            if _dominated(table.get(built, ()), when, left, after):
+                continue
+            heapq.heappush(heap, (when, -left, counter, after, built, (node, actions)))
+            counter += 1
+    if fallback and greedy is not None:
+        return Plan(greedy, finish, expanded)
+    return None
+
+
+def _unwind(node):
+    """Follows parent links back to the start and returns the actions in order."""
+    steps = []
+    while node[0] is not None:
+        steps.append(node[1])
+        node = node[0]
+    return [action for actions in reversed(steps) for action in actions]
+
+
+def next_step(player, goal, max_states=PLANMAXSTATES, max_seconds=None):
+    """
+    Describes the first action of a plan() for goal, falling back to
+    the helper-free plan if the search runs out of budget.
+    -------------------------------------------------------
+    Parameters:
+        - max_states, max_seconds : search budget passed to plan()
+
+    Returns:
+        - short text such as "Gather Wood (about 9 days to goal)",
+          or a message when the goal is reached or out of reach
+    """
+    result = plan(player, goal, max_states=max_states,
+                  max_seconds=max_seconds, fallback=True)
+    if result is None:
+        return "No plan found."
+    if not result.actions:
+        return "Goal reached!"
+    kind, name = result.actions[0]
+    label = 'Sleep' if kind == 'sleep' else f"{kind.capitalize()} {name.replace('_', ' ').title()}"
+    return f"{label} (about {result.days} day{'s' if result.days != 1 else ''} to goal)"
@@ -4,6 +4,18 @@ player.py
 Player class that represents the player's current state, 
 including available actions, resources, and constructed buildings.
 
+Resources and buildings are stored as fixed-length integer arrays
+indexed by RESOURCES / BUILDINGS order. Player.resources and
+Player.buildings are dict-compatible views (CountView) over them,
+so existing code can keep using names, while costs are checked and
+spent as fixed-length vectors.
+
+Every change to a count bumps Player.version and adds the name to
+Player.dirty_resources / Player.dirty_buildings, so views re-render
+only what changed (take_changes()) and caches can key on the
+version. Writing to resource_counts / building_counts directly
+bypasses this.
+
 Player:
     Represents the player and tracks resources, buildings, and actions left per turn.
 
@@ -12,17 +24,271 @@ Player:
         any bonus from town_hall buildings.
 
     - can_afford(self, cost):
-        Checks if the player has enough resources to afford a given cost tuple
-        (wood, stone, iron, gold, food). Returns True if affordable, False otherwise.
+        Checks if the player has enough resources to afford a given cost
+        (dict or cost vector). Returns True if affordable, False otherwise.
 
     - spend(self, cost):
-        Deducts resources from the player according to the given cost tuple.
+        Deducts resources from the player according to the given cost.
 
     - add_building(self, name):
         Increments the count of a specified building in the player's buildings dictionary
         if it exists.
+
+    - gather(self, name):
+        Spends an action to gather a resource (1 + one per house).
+
+    - build(self, name):
+        Spends an action and the building's cost to construct a building.
+
+    - produce(self, days=1):
+        Adds days of production from the player's buildings.
+
+    - reset(self):
+        Returns the player to the starting state.
+
+    - affordability(self):
+        Affordability of every building from the current resources.
+
+    - days_until_affordable(self, name=None):
+        Days of production until each building (or one) becomes affordable.
+
+    - unproduced_shortfall(self, name=None):
+        The short resource nothing produces, per building (or for one).
+
+    - take_changes(self):
+        Returns and clears the names changed since the last call.
+
+CountView:
+    Dict-compatible view of an integer array under fixed names.
+
+PRODUCTION:
+    Maps each producing building to the resource it yields per day.
+
+RESOURCES / BUILDINGS:
+    Canonical ordering of resource and building names; the array
+    index of each name (RESOURCEINDEX / BUILDINGINDEX) never changes.
+
+COSTVECTORS:
+    Each building's cost as a tuple in RESOURCES order.
+
+COSTMATRIX:
+    The cost vectors of every building in BUILDINGS order.
+
+YIELDPAIRS:
+    (building index, resource index) of every producing building.
+
+HOUSE / TOWNHALL:
+    BUILDINGS indices of the house (gather bonus) and town hall
+    (action bonus).
+
+affordability(resources):
+    Affordable flags, max buildable counts and bottleneck resources
+    for every building at once, memoized on the resource tuple.
+
+days_until_affordable(resources, buildings):
+    Days of passive production until each building is affordable,
+    in closed form, memoized on the state.
+
+unproduced_shortfall(resources, buildings):
+    For each building, a resource it is short of that no building
+    produces, memoized on the state.
 """
 
+from array import array
+from collections import namedtuple
+from collections.abc import MutableMapping
+from functools import lru_cache
+
+from tooltip import BUILDINGCOSTS
+
+RESOURCES = ('wood', 'stone', 'iron', 'gold', 'food')
+BUILDINGS = ('lumber_yard', 'quarry', 'gold_mine', 'iron_mine', 'farm', 'house', 'town_hall')
+RESOURCEINDEX = {name: i for i, name in enumerate(RESOURCES)}
+BUILDINGINDEX = {name: i for i, name in enumerate(BUILDINGS)}
+
+PRODUCTION = {
+    'lumber_yard': 'wood',
+    'quarry': 'stone',
+    'iron_mine': 'iron',
+    'gold_mine': 'gold',
+    'farm': 'food',
+}
+
+COSTVECTORS = {name: tuple(cost.get(resource, 0) for resource in RESOURCES)
+               for name, cost in BUILDINGCOSTS.items()}
+COSTMATRIX = tuple(COSTVECTORS[name] for name in BUILDINGS)
+
+# (building index, resource index) for every producing building
+YIELDPAIRS = tuple((BUILDINGINDEX[building], RESOURCEINDEX[resource])
+                for building, resource in PRODUCTION.items())
+HOUSE = BUILDINGINDEX['house']
+TOWNHALL = BUILDINGINDEX['town_hall']
+
+
+def cost_vector(cost):
+    """Returns a cost dict (lowercase resource names) as a tuple in RESOURCES order."""
+    if isinstance(cost, tuple):
+        return cost
+    return tuple(cost.get(resource, 0) for resource in RESOURCES)
+
+
+class Affordability(namedtuple('Affordability', ('affordable', 'buildable', 'bottleneck'))):
+    """
+    What every building costs against one set of resources.
+    -----------------------------------------------------------------------------
+    Each field is a tuple in BUILDINGS order:
+        - affordable : True if one can be built now
+        - buildable : how many could be bought with the resources alone
+        - bottleneck : resource limiting buildable (None if free)
+    """
+    __slots__ = ()
+
+    def of(self, name):
+        """Returns (affordable, buildable, bottleneck) for one building."""
+        i = BUILDINGINDEX[name]
+        return self.affordable[i], self.buildable[i], self.bottleneck[i]
+
+
+@lru_cache(maxsize=256)
+def affordability(resources):
+    """
+    Computes affordability for every building in one pass over COSTMATRIX.
+    -----------------------------------------------------------------------------
+    Parameters:
+        - resources : tuple of counts in RESOURCES order (hashable, so
+          results are memoized until the resources change)
+
+    Returns:
+        - Affordability
+    """
+    buildable, bottleneck = [], []
+    for cost in COSTMATRIX:
+        count, limit = None, None
+        for r, need in enumerate(cost):
+            if need > 0:
+                fits = max(resources[r], 0) // need
+                if count is None or fits < count:
+                    count, limit = fits, RESOURCES[r]
+        buildable.append(count if count is not None else 0)
+        bottleneck.append(limit)
+    return Affordability(tuple(count > 0 or limit is None for count, limit in zip(buildable, bottleneck)),
+                         tuple(buildable), tuple(bottleneck))
+
+
+@lru_cache(maxsize=256)
+def days_until_affordable(resources, buildings):
+    """
+    Days of passive production until each building becomes affordable.
+    -----------------------------------------------------------------------------
+    Production adds a fixed amount per day, so for every resource that
+    is short the wait is ceil(shortfall / daily yield), and a building
+    waits for its slowest resource.
+
+    Parameters:
+        - resources : tuple of counts in RESOURCES order
+        - buildings : tuple of counts in BUILDINGS order
+
+    Returns:
+        - tuple in BUILDINGS order: 0 if affordable now, the number of
+          days otherwise, or None if a missing resource is not produced
+    """
+    rates = _production_rates(buildings)
+    days = []
+    for cost in COSTMATRIX:
+        wait = 0
+        for have, need, rate in zip(resources, cost, rates):
+            if need > have:
+                if rate <= 0:
+                    wait = None
+                    break
+                wait = max(wait, -((have - need) // rate))
+        days.append(wait)
+    return tuple(days)
+
+
+@lru_cache(maxsize=256)
+def unproduced_shortfall(resources, buildings):
+    """
+    Finds what keeps production alone from paying for each building.
+    -----------------------------------------------------------------------------
+    Parameters:
+        - resources : tuple of counts in RESOURCES order
+        - buildings : tuple of counts in BUILDINGS order
+
+    Returns:
+        - tuple in BUILDINGS order: the first resource (RESOURCES order)
+          the building is short of with no production, or None (exactly
+          where days_until_affordable() gives a number of days)
+    """
+    rates = _production_rates(buildings)
+    return tuple(next((RESOURCES[r] for r, (have, need) in enumerate(zip(resources, cost))
+                       if need > have and rates[r] <= 0), None)
+                 for cost in COSTMATRIX)
+
+
+def _production_rates(buildings):
+    """Daily yield of each resource, in RESOURCES order, from building counts."""
+    rates = [0] * len(RESOURCES)
+    for building, resource in YIELDPAIRS:
+        rates[resource] += buildings[building]
+    return rates
+
+
+class CountView(MutableMapping):
+    """
+    Dict-compatible view of an integer array under fixed names.
+    -----------------------------------------------------------------------------
+    Reads and writes go straight to the array; the set of names is
+    fixed, so items cannot be added or deleted. Writes that change a
+    count call on_change(names) with the names changed.
+    """
+    __slots__ = ('array', 'index', 'on_change')
+
+    def __init__(self, array, index, on_change=None):
+        self.array = array
+        self.index = index
+        self.on_change = on_change
+
+    def __getitem__(self, name):
+        return self.array[self.index[name]]
+
+    def __setitem__(self, name, value):
+        i = self.index[name]
+        if self.array[i] != value:
+            self.array[i] = value
+            if self.on_change is not None:
+                self.on_change((name,))
+
+    def __delitem__(self, name):
+        raise TypeError("Player counts have fixed names and cannot be deleted.")
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def assign(self, values):
+        """
+        Overwrites every count from a mapping; names it lacks become 0.
+        Unknown names raise KeyError.
+        """
+        counts = [0] * len(self.index)
+        for name, value in values.items():
+            counts[self.index[name]] = value
+        changed = [name for name, i in self.index.items() if self.array[i] != counts[i]]
+        if changed:
+            self.array[:] = array('q', counts)
+            if self.on_change is not None:
+                self.on_change(changed)
+
+
 class Player:
     """Represents the player, tracking actions, resources, and buildings."""
 
@@ -33,15 +299,21 @@ class Player:
         Attributes:
             - actions_left : int
                 Number of actions the player can take (3 + town_hall bonus)
-            - resources : dict
-                Dictionary tracking the player's current resources:
+            - resource_counts : array('q') in RESOURCES order
+            - building_counts : array('q') in BUILDINGS order
+            - version : int
+                Incremented on every change to a resource or building count
+            - dirty_resources / dirty_buildings : set
+                Names changed since the last take_changes()
+            - resources : CountView
+                Dict-compatible view tracking the player's current resources:
                     * wood   : int
                     * stone  : int
                     * iron   : int
                     * gold   : int
                     * food   : int
-            - buildings : dict
-                Dictionary tracking the player's buildings:
+            - buildings : CountView
+                Dict-compatible view tracking the player's buildings:
                     * lumber_yard
                     * quarry
                     * gold_mine
@@ -50,59 +322,95 @@ class Player:
                     * house
                     * town_hall
         """
-        self.resources = {
-            'wood': 0,
-            'stone': 0,
-            'iron': 0,
-            'gold': 0,
-            'food': 0
-        }
-        self.buildings = {
-            'lumber_yard': 0,
-            'quarry': 0,
-            'gold_mine': 0,
-            'iron_mine': 0,
-            'farm': 0,
-            'house': 0,
-            'town_hall': 0
-        }
-        self.actions_left = 3 + (1 * self.buildings['town_hall'])
+        self.resource_counts = array('q', bytes(8 * len(RESOURCES)))
+        self.building_counts = array('q', bytes(8 * len(BUILDINGS)))
+        self.version = 0
+        self.dirty_resources = set()
+        self.dirty_buildings = set()
+        self._resources = CountView(self.resource_counts, RESOURCEINDEX, self._resources_changed)
+        self._buildings = CountView(self.building_counts, BUILDINGINDEX, self._buildings_changed)
+        self.reset()
+
+    @property
+    def resources(self):
+        """Dict-compatible view of the resource counts."""
+        return self._resources
+
+    @resources.setter
+    def resources(self, values):
+        self._resources.assign(values)
+
+    @property
+    def buildings(self):
+        """Dict-compatible view of the building counts."""
+        return self._buildings
+
+    @buildings.setter
+    def buildings(self, values):
+        self._buildings.assign(values)
+
+    def _resources_changed(self, names):
+        self.dirty_resources.update(names)
+        self.version += 1
+
+    def _buildings_changed(self, names):
+        self.dirty_buildings.update(names)
+        self.version += 1
+
+    def take_changes(self):
+        """
+        Returns and clears the names changed since the last call.
+        -----------------------------------------------------------------------------
+        Returns:
+            - (resources, buildings) : sets of changed names
+        """
+        changes = self.dirty_resources, self.dirty_buildings
+        self.dirty_resources, self.dirty_buildings = set(), set()
+        return changes
+
+    def reset(self):
+        """
+        Returns the player to the starting state: no resources, no buildings
+        and a full set of actions.
+        """
+        self._resources.assign({})
+        self._buildings.assign({})
+        self.reset_actions()
 
     def reset_actions(self):
         """
         Resets the player's available actions to the default number (3)
         plus any bonus from town_hall buildings.
         """
-        self.actions_left = 3 + (1 * self.buildings['town_hall'])
+        self.actions_left = 3 + (1 * self.building_counts[TOWNHALL])
 
     def can_afford(self, cost):
         """
-        Checks if the player has enough resources to afford a cost tuple.
+        Checks if the player has enough resources to afford a cost.
         -----------------------------------------------------------------------------
         Parameters:
-            - cost : dict (wood, stone, iron, gold, food)
+            - cost : dict (wood, stone, iron, gold, food) or cost vector
         
         Returns:
             - True if the player has enough resources, False otherwise
         """
-        return (self.resources['wood'] >= cost.get('Wood', 0) and
-                self.resources['stone'] >= cost.get('Stone', 0) and
-                self.resources['iron'] >= cost.get('Iron', 0) and
-                self.resources['gold'] >= cost.get('Gold', 0) and
-                self.resources['food'] >= cost.get('Food', 0))
+        return all(have >= need for have, need in zip(self.resource_counts, cost_vector(cost)))
 
     def spend(self, cost):
         """
-        Deducts resources from the player according to the given cost tuple.
+        Deducts resources from the player according to the given cost.
         -----------------------------------------------------------------------------
         Parameters:
-            - cost : dict (wood, stone, iron, gold, food)
+            - cost : dict (wood, stone, iron, gold, food) or cost vector
         """
-        self.resources['wood'] -= cost.get('wood',0)
-        self.resources['stone'] -= cost.get('stone',0)
-        self.resources['iron'] -= cost.get('iron',0)
-        self.resources['gold'] -= cost.get('gold',0)
-        self.resources['food'] -= cost.get('food',0)
+        counts = self.resource_counts
+        spent = []
+        for i, need in enumerate(cost_vector(cost)):
+            if need:
+                counts[i] -= need
+                spent.append(RESOURCES[i])
+        if spent:
+            self._resources_changed(spent)
 
     def add_building(self, name):
         """
@@ -115,5 +423,97 @@ class Player:
         Updates:
             - self.buildings[name] : increments by 1 if the building exists
         """
-        if name in self.buildings:
-            self.buildings[name] += 1
+        if name in BUILDINGINDEX:
+            self.building_counts[BUILDINGINDEX[name]] += 1
+            self._buildings_changed((name,))
+
+    def gather(self, name):
+        """
+        Spends one action to gather a resource.
+        -----------------------------------------------------------------------------
+        Parameters:
+            - name : string
+                Resource to gather
+
+        Returns:
+            - int amount gathered (1 + one per house), 0 if no actions are left
+        """
+        if self.actions_left <= 0:
+            return 0
+        amount = 1 + self.building_counts[HOUSE]
+        self.resource_counts[RESOURCEINDEX[name]] += amount
+        self._resources_changed((name,))
+        self.actions_left -= 1
+        return amount
+
+    def build(self, name):
+        """
+        Spends one action and the building's cost to construct a building.
+        -----------------------------------------------------------------------------
+        Parameters:
+            - name : string
+                Building to construct
+
+        Returns:
+            - True if the building was constructed, False otherwise
+        """
+        cost = COSTVECTORS[name]
+        if self.actions_left <= 0 or not self.can_afford(cost):
+            return False
+        self.spend(cost)
+        self.add_building(name)
+        self.actions_left -= 1
+        return True
+
+    def affordability(self):
+        """
+        Affordability of every building from the current resources.
+        -----------------------------------------------------------------------------
+        Returns:
+            - Affordability, shared with any other call made with the same
+              resources (see affordability())
+        """
+        return affordability(tuple(self.resource_counts))
+
+    def days_until_affordable(self, name=None):
+        """
+        Days of production until each building becomes affordable.
+        -----------------------------------------------------------------------------
+        Parameters:
+            - name : optional building name
+
+        Returns:
+            - tuple in BUILDINGS order (see days_until_affordable()), or
+              the entry for name if given
+        """
+        days = days_until_affordable(tuple(self.resource_counts), tuple(self.building_counts))
+        return days if name is None else days[BUILDINGINDEX[name]]
+
+    def unproduced_shortfall(self, name=None):
+        """
+        The short resource nothing produces, for each building.
+        -----------------------------------------------------------------------------
+        Parameters:
+            - name : optional building name
+
+        Returns:
+            - tuple in BUILDINGS order (see unproduced_shortfall()), or
+              the entry for name if given
+        """
+        short = unproduced_shortfall(tuple(self.resource_counts), tuple(self.building_counts))
+        return short if name is None else short[BUILDINGINDEX[name]]
+
+    def produce(self, days=1):
+        """
+        Adds days of production: each producing building yields one of its
+        resource per day. Nothing else changes overnight, so several days
+        are a single multiplication.
+        """
+        resources, buildings = self.resource_counts, self.building_counts
+        produced = []
+        for building, resource in YIELDPAIRS:
+            if buildings[building] and days:
+                resources[resource] += buildings[building] * days
+                produced.append(RESOURCES[resource])
+        if produced:
+            self._resources_changed(produced)
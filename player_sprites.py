@@ -2,12 +2,15 @@
 player_sprites.py
     Resources - Represents a resource icon and its current value.
         __init__ - Initializes the resource sprite with player reference and position.
-        gather - Handles gathering the resource when clicked.
-        update_image - Refreshes the sprite's image to display the current amount.
+        gather - Click handler that gathers the resource.
+        update_image - Refreshes the sprite's image to display the current amount
+            (composed from cached glyphs, large amounts shown compactly).
     Buildings - Represents a building icon and its current value.
         __init__ - Initializes the building sprite with player reference and position.
-        purchase - Handles purchasing the building when clicked.
-        update_image - Refreshes the sprite's image to display the current amount.
+        purchase - Click handler that purchases the building.
+        refresh - Shows a new count and affordability, re-rendering only on change.
+        update_image - Refreshes the sprite's image to display the current amount,
+            greyed out when unaffordable and badged with how many can be bought.
 """
 
 # Standard Library Imports
@@ -18,12 +21,12 @@ import pygame
 # My Imports
 from sprites import Entity
 from globals import *
-from interaction import check_interaction
-from tooltip import BUILDINGCOSTS
+from assets import load_image, load_font, blit_counter, render_counter
 
 
 class Resources(Entity):
     """Represents a resource icon and its current value."""
+    _layer = RESOURCELAYER
     
     def __init__(self, groups, player, scene, name=None, image=None, position=(0, 0)):
         """
@@ -34,7 +37,7 @@ class Resources(Entity):
         Parameters:
             - groups : list of pygame.sprite.Group to add this sprite to
             - player : Player object, used for resource tracking
-            - scene : Scene object, used for interaction checks
+            - scene : Scene object owning this sprite
             - name : Name of the resource (wood, stone, etc.)
             - image : Optional pygame.Surface for the sprite
             - position : Top-left coordinates for placement
@@ -43,7 +46,7 @@ class Resources(Entity):
         self.player = player
         self.scene = scene
         self.value = self.player.resources[self.name.lower()]
-        self.font = pygame.font.SysFont(None, 32)
+        self.font = load_font(None, 32)
         
         if image is None and name is not None:
             image = pygame.Surface((RESOURCEWIDTH, RESOURCEHEIGHT))
@@ -60,21 +63,13 @@ class Resources(Entity):
         Handles gathering resources when clicked.
         Updates the player's resources, decrements actions, and refreshes the image.
         -------------------------------------------------------------
-        Called in:
-            - Scene update loop when player interacts with resource
+        Called by:
+            - Scene.dispatcher when the player clicks this resource
         """
-        if check_interaction(self, self.scene):
-            if self.player.actions_left <= 0:
-                return False
-            
-            bonus = self.player.buildings['house']
-            amount = 1 + bonus
-
-            self.player.resources[self.name] += amount
-            self.player.actions_left -= 1
-
-            self.value = self.player.resources[self.name]
-            self.update_image()
+        if not self.scene.engine.gather(self.name):
+            return False
+        self.scene.record_action('gather', resource=self.name)
+        self.scene.sync_player()
     
     def update_image(self):
         """
@@ -82,11 +77,9 @@ class Resources(Entity):
         -------------------------------------------------------------
         Called when the resource amount changes.
         """
-        image = pygame.image.load(f'res/{self.name.lower()}.png')
-        image = pygame.transform.scale(image, (RESOURCEWIDTH, RESOURCEHEIGHT))
-        text_surf = self.font.render(f"{self.name.capitalize()} : {self.value}", True, 'black')
-        text_rect = text_surf.get_rect(midright=(RESOURCEWIDTH - 25, RESOURCEHEIGHT // 2))
-        image.blit(text_surf, text_rect)
+        background = load_image(f'res/{self.name.lower()}.png', (RESOURCEWIDTH, RESOURCEHEIGHT))
+        image = render_counter(background, self.font, f"{self.name.capitalize()} : ", self.value,
+                               midright=(RESOURCEWIDTH - 25, RESOURCEHEIGHT // 2))
 
         self.image = image
         self.rect = self.image.get_rect(topleft=self.rect.topleft)
@@ -94,6 +87,7 @@ class Resources(Entity):
 
 class Buildings(Entity):
     """Represents a building icon and its current value."""
+    _layer = BUILDINGLAYER
     
     def __init__(self, groups, player, scene, name=None, image=None, position=(0, 0), value=0):
         """
@@ -104,7 +98,7 @@ class Buildings(Entity):
         Parameters:
             - groups : list of pygame.sprite.Group to add this sprite to
             - player : Player object, used for building tracking
-            - scene : Scene object, used for interaction checks
+            - scene : Scene object owning this sprite
             - name : Name of the building (lumber_yard, mine, etc.)
             - image : Optional pygame.Surface for the sprite
             - position : Top-left coordinates for placement
@@ -115,7 +109,9 @@ class Buildings(Entity):
         self.scene = scene
         self.position = position
         self.value = value
-        self.font = pygame.font.SysFont(None, 20)
+        self.font = load_font(None, 20)
+        self.badge_font = load_font(None, 18, bold=True)
+        self.status = player.affordability().of(name)[:2]
 
         if image is None and name is not None:
             image = pygame.Surface((BUILDINGWIDTH, BUILDINGHEIGHT))
@@ -126,24 +122,29 @@ class Buildings(Entity):
         self.update_image()
 
     def purchase(self):
-        if not check_interaction(self, self.scene):
-            return False
-
-        cost_dict = BUILDINGCOSTS[self.name]
-
-        if self.player.actions_left <= 0 or not self.player.can_afford(cost_dict):
+        """
+        Buys one of this building if the player can afford it.
+        -------------------------------------------------------------
+        Called by:
+            - Scene.dispatcher when the player clicks this building
+        """
+        if not self.scene.engine.build(self.name):
             return False
+        self.scene.record_action('build', building=self.name)
+        self.scene.sync_player()
 
-        self.player.spend(cost_dict)
-        self.player.buildings[self.name] += 1
-        self.player.actions_left -= 1
-        self.value = self.player.buildings[self.name]
-
-        self.update_image()
-        for resource_sprite in self.scene.resource_group:
-            self.scene.update_resource(resource_sprite)
-
-
+    def refresh(self, value, status):
+        """
+        Shows a new count and affordability, re-rendering once and only
+        if either changed.
+        -------------------------------------------------------------
+        Parameters:
+            - value : number of this building owned
+            - status : (affordable, buildable) from Player.affordability()
+        """
+        if value != self.value or status != self.status:
+            self.value, self.status = value, status
+            self.update_image()
 
     def update_image(self):
         """
@@ -151,11 +152,16 @@ class Buildings(Entity):
         -------------------------------------------------------------
         Called when the building amount changes.
         """
-        image = pygame.image.load(f'res/{self.name.lower()}.png')
-        image = pygame.transform.scale(image, (BUILDINGWIDTH, BUILDINGHEIGHT))
-        text_surf = self.font.render(f"{self.name.replace('_', ' ').title()} : {self.value}", True, 'black')
-        text_rect = text_surf.get_rect(midright=(BUILDINGWIDTH - 25, BUILDINGHEIGHT // 2))
-        image.blit(text_surf, text_rect)
+        background = load_image(f'res/{self.name.lower()}.png', (BUILDINGWIDTH, BUILDINGHEIGHT))
+        image = render_counter(background, self.font, f"{self.name.replace('_', ' ').title()} : ", self.value,
+                               midright=(BUILDINGWIDTH - 25, BUILDINGHEIGHT // 2))
+
+        affordable, buildable = self.status
+        if not affordable:
+            shade = (UNAFFORDABLESHADE,) * 3
+            image.fill(shade, special_flags=pygame.BLEND_RGB_MULT)
+        elif buildable > 0:
+            blit_counter(image, self.badge_font, 'x', buildable, 'darkgreen', topright=(BUILDINGWIDTH - 4, 2))
 
         self.image = image
         self.rect = self.image.get_rect(topleft=self.rect.topleft)
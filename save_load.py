@@ -5,63 +5,763 @@ Provides functions for saving and loading the current
 game state, including the current date, player resources,
 buildings, and actions left.
 
+Saves are written by a background SaveWriter thread: the
+state is snapshotted on the main thread, serialized off it,
+written to a temp file and moved over the save with
+os.replace, so a crash mid-write never corrupts the save.
+Saves requested while a write is pending are coalesced
+into one write of the latest state.
+
+Between snapshots, every player action (gather, build,
+sleep, reset) is appended as one JSON line to a journal.
+Each entry carries a sequence number and every snapshot
+records the last sequence number it includes, so loading
+restores the snapshot and replays only the newer entries.
+Once a snapshot is on disk the journal is compacted down
+to the entries it does not cover.
+
+Saves live in named slots under SAVEDIR, each with its own
+snapshot and journal. A small index file (SaveIndex) keeps
+each slot's date, resource totals, building counts and
+last-modified time, so slots can be listed without opening
+any save. The index is updated by the writer thread after
+every write and rebuilt from the slot files if it is lost.
+
+Snapshots are stored in a compact struct-packed binary
+format (SAVEFORMAT = 'binary') headed by a magic number and
+a schema version, or as JSON (SAVEFORMAT = 'json'). Either
+is recognised on load. Saves from older schema versions are
+upgraded by the migration hooks registered in MIGRATIONS;
+the original JSON saves count as version 0. A save that is
+truncated, corrupt or from a newer version is reported and
+set aside (renamed with a '.corrupt' suffix, with its
+journal) instead of crashing the game.
+
+Classes:
+
+SaveWriter:
+    Background thread that encodes snapshots and writes them
+    atomically.
+
+Journal:
+    Append-only log of player actions.
+
+SaveIndex:
+    Metadata for every save slot, kept in one small file.
+
 Functions:
 
-save_game(game):
-    Saves the current game state to a JSON file.
+slot_path(slot=None) / journal_path(slot=None):
+    File paths of a slot's snapshot and journal.
+
+select_slot(slot):
+    Makes slot the one saved to, loaded from and journaled.
+
+list_slots():
+    Returns slot metadata from the index, newest first.
+
+snapshot(game):
+    Returns a plain-dict copy of the state that gets saved.
+
+encode_state(state) / decode_state(payload):
+    Converts a state dict to and from the binary format.
+
+migration(version):
+    Decorator registering a hook that upgrades a state dict
+    from one schema version to the next.
 
-load_game(game):
-    Loads a saved game state from a JSON file and updates
-    the game and sprite values.
+read_state(path=None):
+    Reads, decodes and migrates a save file.
+
+export_json(path=EXPORTPATH, slot=None):
+    Writes a slot's save as indented JSON for debugging.
+
+save_game(game, slot=None):
+    Queues the current game state to be written to a slot.
+
+journal_action(action, **fields):
+    Appends a player action to the journal.
+
+replay(game, entries):
+    Re-applies journaled actions to the game state.
+
+flush_saves(timeout=None):
+    Blocks until every queued save has been written.
+
+load_game(game, slot=None):
+    Loads a slot's saved game state, applies it in bulk and
+    re-renders each changed sprite once.
+
+clear_save(slot=None):
+    Deletes a slot's save, journal and index entry.
 """
 
 import os
 import json
+import struct
+import threading
+import time
+from datetime import datetime
+
+from player import RESOURCES, BUILDINGS
+
+SAVEDIR = "saves"
+INDEXPATH = os.path.join(SAVEDIR, "index.json")
+DEFAULTSLOT = "savegame"
+LEGACYPATHS = ("savegame.sav", "savegame.json")    # single-file saves, read by DEFAULTSLOT
+EXPORTPATH = "savegame.export.json"
+SAVEFORMAT = 'binary'               # 'binary' or 'json'
+SAVEVERSION = 1
+MAGIC = b'CRCS'
+
+# magic, schema version, resource count, building count
+HEADER = struct.Struct('<4sHBB')
+# journal seq, year, month, day, actions left
+DATE = struct.Struct('<QHBBH')
+COMPACTEVERY = 25   # journaled actions between snapshots
+
+
+class SaveWriter:
+    """
+    Writes save snapshots on a background thread.
+    -------------------------------------------------------
+    Only the latest snapshot per path is kept while waiting, so
+    a burst of saves costs a single write. Each write goes to a
+    temp file next to the target, is fsynced, and then replaces
+    the target atomically.
+    """
+
+    def __init__(self):
+        self._pending = {}                  # path -> (latest snapshot, on_written)
+        self._busy = False                  # a write is in progress
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def submit(self, path, data, on_written=None):
+        """
+        Queues data to be written to path, replacing any snapshot
+        still waiting for the same path.
+        -------------------------------------------------------
+        Parameters:
+            - path : destination file
+            - data : JSON-serializable snapshot
+            - on_written : Optional callable(data) run on the writer
+              thread once data is safely on disk
+        """
+        with self._cond:
+            self._pending[path] = (data, on_written)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='SaveWriter', daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def discard(self, path):
+        """
+        Drops any snapshot waiting for path and waits for an
+        in-progress write to finish, so the caller can delete
+        the file without it being written again.
+        """
+        with self._cond:
+            self._pending.pop(path, None)
+            while self._busy:
+                self._cond.wait()
+
+    def flush(self, timeout=None):
+        """
+        Blocks until every queued snapshot has been written.
+        -------------------------------------------------------
+        Returns:
+            - True if everything was written, False on timeout
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending)
+                path, (data, on_written) = self._pending.popitem()
+                self._busy = True
+            try:
+                write_atomic(path, encode(data))
+                if on_written is not None:
+                    on_written(data)
+                print("Game saved.")
+            except OSError as error:
+                print(f"Save failed: {error}")
+            except Exception as error:   # keep the writer alive for the saves still queued
+                print(f"Save failed: {type(error).__name__}: {error}")
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+
+def write_atomic(path, payload):
+    """
+    Writes payload to path via a temp file and os.replace.
+    -------------------------------------------------------
+    Parameters:
+        - path : destination file
+        - payload : bytes to write
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class Journal:
+    """
+    Append-only log of player actions, one JSON object per line.
+    -------------------------------------------------------
+    Attributes:
+        - path : journal file
+        - seq : sequence number of the last recorded action
+        - since_snapshot : actions recorded since the last snapshot
+    """
+
+    def __init__(self, path, seq=0):
+        """
+        Opens a journal, continuing the numbering of what is on disk.
+        -------------------------------------------------------
+        Parameters:
+            - path : journal file
+            - seq : sequence number the slot's snapshot covers; new
+              actions are numbered after it and after any entry
+              already in the file
+        """
+        self.path = path
+        self.seq = seq
+        self.since_snapshot = 0
+        self._file = None
+        self._lock = threading.Lock()
+        entries = self.entries(after=seq)
+        if entries:
+            self.seq = entries[-1]['seq']
+            self.since_snapshot = len(entries)
+
+    def record(self, action, **fields):
+        """
+        Appends an action to the journal.
+        -------------------------------------------------------
+        Parameters:
+            - action : 'gather', 'build', 'sleep' or 'reset'
+            - fields : action arguments (e.g. resource='wood')
+        """
+        with self._lock:
+            self.seq += 1
+            self.since_snapshot += 1
+            if self._file is None:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                self._file = open(self.path, 'a')
+            self._file.write(json.dumps(dict(fields, seq=self.seq, action=action),
+                                        separators=(',', ':')) + '\n')
+            self._file.flush()
+
+    def entries(self, after=0):
+        """
+        Reads the journaled actions newer than a snapshot.
+        -------------------------------------------------------
+        Parameters:
+            - after : sequence number already covered by the snapshot
+
+        Returns:
+            - list of action dicts in recorded order. A line torn by a
+              crash mid-append is ignored.
+        """
+        if not os.path.exists(self.path):
+            return []
+        entries = []
+        with self._lock, open(self.path, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                if entry['seq'] > after:
+                    entries.append(entry)
+        return entries
+
+    def compact(self, seq):
+        """
+        Drops the entries a snapshot written at seq already covers.
+        -------------------------------------------------------
+        Called on the SaveWriter thread once the snapshot is on disk.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if not os.path.exists(self.path):
+                return
+            with open(self.path, 'r') as f:
+                lines = f.readlines()
+            keep = []
+            for line in lines:
+                try:
+                    if json.loads(line)['seq'] > seq:
+                        keep.append(line)
+                except ValueError:
+                    break
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.writelines(keep)
+            os.replace(tmp_path, self.path)
 
-FILEPATH = "savegame.json"
+    def close(self):
+        """Closes the journal file; the next record reopens it."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
 
-def save_game(game):
+    def clear(self):
+        """Deletes the journal file and restarts numbering."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            self.seq = 0
+            self.since_snapshot = 0
+
+
+class SaveIndex:
     """
-    Saves the current game state to a JSON file.
+    Metadata for every save slot, kept in one small JSON file.
+    -------------------------------------------------------
+    Each entry holds the slot's date, resource totals, building
+    counts and last-modified time. Updates come from the writer
+    thread; reads come from the main thread. A single-file save
+    from before slots (LEGACYPATHS) is listed as DEFAULTSLOT
+    until that slot is saved under SAVEDIR.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._slots = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._slots is None:
+            try:
+                with open(self.path, 'r') as f:
+                    self._slots = json.load(f)
+            except (OSError, ValueError):
+                self._slots = self._scan()
+            if DEFAULTSLOT not in self._slots:
+                self._add_legacy(self._slots)
+        return self._slots
+
+    def _scan(self):
+        """Rebuilds the index by reading every slot file in SAVEDIR."""
+        slots = {}
+        if not os.path.isdir(SAVEDIR):
+            return slots
+        for filename in os.listdir(SAVEDIR):
+            name, ext = os.path.splitext(filename)
+            if ext != '.sav':
+                continue
+            path = os.path.join(SAVEDIR, filename)
+            try:
+                slots[name] = metadata(read_state(path), os.path.getmtime(path))
+            except (OSError, ValueError):
+                continue
+        return slots
+
+    def _add_legacy(self, slots):
+        """Adds DEFAULTSLOT from the first LEGACYPATHS save that reads."""
+        for path in LEGACYPATHS:
+            if not os.path.exists(path):
+                continue
+            try:
+                slots[DEFAULTSLOT] = metadata(read_state(path), os.path.getmtime(path))
+                return
+            except (OSError, ValueError):
+                continue
+
+    def _write(self):
+        os.makedirs(SAVEDIR, exist_ok=True)
+        write_atomic(self.path, json.dumps(self._slots, separators=(',', ':')).encode())
+
+    def update(self, slot, state):
+        """Records a slot's metadata after its snapshot is written."""
+        with self._lock:
+            self._load()[slot] = metadata(state, time.time())
+            self._write()
+
+    def remove(self, slot):
+        """Drops a slot from the index."""
+        with self._lock:
+            if self._load().pop(slot, None) is not None:
+                self._write()
+
+    def slots(self):
+        """Returns a copy of every slot's metadata."""
+        with self._lock:
+            return dict(self._load())
+
+
+def metadata(state, modified):
+    """
+    Summarises a state dict for the save index.
+    -------------------------------------------------------
+    Returns:
+        - dict with 'date', 'resources' and 'buildings' (per-name
+          totals) and 'modified' (epoch seconds)
+    """
+    date = state['date']
+    player = state['player']
+    return {
+        'date'      : f"{date['year']:04d}-{date['month']:02d}-{date['day']:02d}",
+        'resources' : dict(player['resources']),
+        'buildings' : dict(player['buildings']),
+        'modified'  : modified
+    }
+
+
+def slot_path(slot=None):
+    """Returns the snapshot file of slot (the active slot by default)."""
+    return os.path.join(SAVEDIR, f"{slot or _slot}.sav")
+
+
+def journal_path(slot=None):
+    """Returns the journal file of slot (the active slot by default)."""
+    return os.path.join(SAVEDIR, f"{slot or _slot}.journal")
+
+
+def select_slot(slot):
+    """
+    Makes slot the one saved to, loaded from and journaled.
+    -------------------------------------------------------
+    Parameters:
+        - slot : slot name; letters, digits, '-' and '_' only
+    """
+    global _slot, _journal
+    if not slot or not all(char.isalnum() or char in '-_' for char in slot):
+        raise ValueError(f"Invalid save slot name: {slot!r}")
+    if slot == _slot:
+        return
+    _journal.close()
+    _slot = slot
+    _writer.flush()     # the slot's newest snapshot may still be queued
+    try:
+        state = read_state()
+    except ValueError:
+        state = None    # reported and set aside by load_game
+    _journal = Journal(journal_path(slot), seq=state.get('seq', 0) if state else 0)
+
+
+def list_slots():
+    """
+    Returns slot metadata from the index without opening any save.
+    -------------------------------------------------------
+    Returns:
+        - list of (slot, metadata) tuples, most recently saved first
+    """
+    return sorted(_index.slots().items(), key=lambda item: item[1]['modified'], reverse=True)
+
+
+_writer = SaveWriter()
+_index = SaveIndex(INDEXPATH)
+_slot = DEFAULTSLOT
+_journal = Journal(journal_path(DEFAULTSLOT))
+
+
+def snapshot(game):
+    """
+    Returns a copy of the state that gets saved.
     -------------------------------------------------------
     Parameters:
         - game : Scene or main game object containing
                  current date, player state, and sprites.
-    
-    Saves:
-        - game.year, game.month, game.today.day
-        - game.player.resources
-        - game.player.buildings
-        - game.player.actions_left
+
+    Returns:
+        - dict safe to serialize on another thread
     """
-    data = {
+    return {
+        'version' : SAVEVERSION,
+        'seq' : _journal.seq,
         'date' : {
-            'year'  : game.year,
-            'month' : game.month,
+            'year'  : game.today.year,
+            'month' : game.today.month,
             'day'   : game.today.day
         },
         'player' : {
-            'resources'    : game.player.resources,
-            'buildings'    : game.player.buildings,
+            'resources'    : dict(game.player.resources),
+            'buildings'    : dict(game.player.buildings),
             'actions_left' : game.player.actions_left
         }
     }
-    with open(FILEPATH, 'w') as f:
-        json.dump(data, f, indent=4)
 
-    print("Game saved.")
+
+def encode_state(state):
+    """
+    Packs a state dict into the binary save format.
+    -------------------------------------------------------
+    Layout (little-endian): HEADER, DATE, one int64 per resource
+    and one uint32 per building, both in player.RESOURCES /
+    player.BUILDINGS order.
+    """
+    date = state['date']
+    player = state['player']
+    return b''.join((
+        HEADER.pack(MAGIC, SAVEVERSION, len(RESOURCES), len(BUILDINGS)),
+        DATE.pack(state['seq'], date['year'], date['month'], date['day'], player['actions_left']),
+        struct.pack(f'<{len(RESOURCES)}q', *(player['resources'][name] for name in RESOURCES)),
+        struct.pack(f'<{len(BUILDINGS)}I', *(player['buildings'][name] for name in BUILDINGS)),
+    ))
 
 
-def load_game(game):
+def decode_state(payload):
     """
-    Loads a saved game state from a JSON file and updates
-    the game object and its sprites accordingly.
+    Unpacks a binary save into a state dict.
+    -------------------------------------------------------
+    Returns:
+        - state dict tagged with the schema version it was written in
+
+    Raises:
+        - ValueError if the payload is not a binary save, is truncated
+          or holds a different number of resources or buildings
+    """
+    if len(payload) < HEADER.size:
+        raise ValueError("Save file is truncated.")
+    magic, version, n_resources, n_buildings = HEADER.unpack_from(payload)
+    if magic != MAGIC:
+        raise ValueError("Not a binary save file.")
+    offset = HEADER.size
+    if (n_resources, n_buildings) != (len(RESOURCES), len(BUILDINGS)):
+        raise ValueError(f"Save has {n_resources} resources and {n_buildings} buildings, "
+                         f"expected {len(RESOURCES)} and {len(BUILDINGS)}.")
+    try:
+        seq, year, month, day, actions_left = DATE.unpack_from(payload, offset)
+        offset += DATE.size
+        resources = struct.unpack_from(f'<{n_resources}q', payload, offset)
+        offset += 8 * n_resources
+        buildings = struct.unpack_from(f'<{n_buildings}I', payload, offset)
+    except struct.error:
+        raise ValueError("Save file is truncated.") from None
+    return {
+        'version' : version,
+        'seq' : seq,
+        'date' : {'year': year, 'month': month, 'day': day},
+        'player' : {
+            'resources'    : dict(zip(RESOURCES, resources)),
+            'buildings'    : dict(zip(BUILDINGS, buildings)),
+            'actions_left' : actions_left
+        }
+    }
+
+
+def encode(state):
+    """Serializes a state dict in the configured SAVEFORMAT."""
+    if SAVEFORMAT == 'json':
+        return json.dumps(state, separators=(',', ':')).encode()
+    return encode_state(state)
+
+
+def decode(payload):
+    """Deserializes a save in either format, recognised by its magic number."""
+    if payload[:len(MAGIC)] == MAGIC:
+        return decode_state(payload)
+    return json.loads(payload)
+
+
+MIGRATIONS = {}
+
+
+def migration(version):
+    """
+    Registers a hook upgrading a state dict from version to version + 1.
     -------------------------------------------------------
+    Parameters:
+        - version : schema version the hook accepts
+    """
+    def register(hook):
+        MIGRATIONS[version] = hook
+        return hook
+    return register
+
+
+@migration(0)
+def _from_legacy_json(state):
+    """Unversioned JSON saves: no journal seq and possibly missing names."""
+    player = state.setdefault('player', {})
+    player['resources'] = {name: player.get('resources', {}).get(name, 0) for name in RESOURCES}
+    player['buildings'] = {name: player.get('buildings', {}).get(name, 0) for name in BUILDINGS}
+    state.setdefault('seq', 0)
+    return state
+
+
+def migrate(state):
+    """
+    Runs the migration hooks until state is at SAVEVERSION.
+    -------------------------------------------------------
+    Raises:
+        - ValueError if state was written by a newer version
+    """
+    version = state.get('version', 0)
+    if version > SAVEVERSION:
+        raise ValueError(f"Save version {version} is newer than this game's ({SAVEVERSION}).")
+    while version < SAVEVERSION:
+        state = MIGRATIONS[version](state)
+        version += 1
+    state['version'] = version
+    return state
+
+
+def read_state(path=None):
+    """
+    Reads, decodes and migrates a save file.
+    -------------------------------------------------------
+    Parameters:
+        - path : save file, defaults to the active slot (which for
+          DEFAULTSLOT falls back to the LEGACYPATHS single-file saves)
+
+    Returns:
+        - state dict at SAVEVERSION, or None if there is no save
+
+    Raises:
+        - ValueError if the save is corrupt, truncated or from a
+          newer version
+    """
+    path = path or _save_file()
+    if path is None or not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        return migrate(decode(f.read()))
+
+
+def _save_file():
+    """Returns the active slot's existing save file, or None."""
+    candidates = (slot_path(),) + (LEGACYPATHS if _slot == DEFAULTSLOT else ())
+    return next((path for path in candidates if os.path.exists(path)), None)
+
+
+def _set_aside(path):
+    """
+    Renames an unreadable save and the active slot's journal with a
+    '.corrupt' suffix, so neither is read again nor lost.
+    """
+    os.replace(path, f"{path}.corrupt")
+    _journal.close()
+    if os.path.exists(_journal.path):
+        os.replace(_journal.path, f"{_journal.path}.corrupt")
+    _journal.clear()
+    _index.remove(_slot)
+
+
+def export_json(path=EXPORTPATH, slot=None):
+    """
+    Writes a slot's save (the active slot by default) as indented
+    JSON for debugging.
+    -------------------------------------------------------
+    Returns:
+        - True if a save existed and was exported
+    """
+    flush_saves()
+    state = read_state(slot_path(slot) if slot else None)
+    if state is None:
+        return False
+    with open(path, 'w') as f:
+        json.dump(state, f, indent=4)
+    return True
+
+
+def save_game(game, slot=None):
+    """
+    Saves the current game state to a save slot.
+    -------------------------------------------------------
+    The state is snapshotted immediately; serialization, the
+    write and the index update happen on the SaveWriter thread.
+
+    Parameters:
+        - game : Scene or main game object containing
+                 current date, player state, and sprites.
+        - slot : slot to save to, selecting it first (defaults
+                 to the active slot). Saving into another slot
+                 replaces its game, so its journal is cleared.
+    
+    Saves:
+        - game.today (year, month, day)
+        - game.player.resources
+        - game.player.buildings
+        - game.player.actions_left
+        - the journal sequence number the snapshot covers
+    """
+    if slot is not None and slot != _slot:
+        select_slot(slot)
+        _journal.clear()    # its actions belong to the game being replaced
+    journal, slot = _journal, _slot
+
+    def on_written(data):
+        journal.compact(data['seq'])
+        _index.update(slot, data)
+
+    os.makedirs(SAVEDIR, exist_ok=True)
+    journal.since_snapshot = 0
+    _writer.submit(slot_path(slot), snapshot(game), on_written)
+
+
+def journal_action(action, **fields):
+    """
+    Appends a player action to the journal.
+    -------------------------------------------------------
+    Parameters:
+        - action : 'gather', 'build', 'sleep' or 'reset'
+        - fields : action arguments (resource, building, date)
+
+    Returns:
+        - True once COMPACTEVERY actions have been journaled since
+          the last snapshot, meaning the caller should save_game()
+    """
+    _journal.record(action, **fields)
+    return _journal.since_snapshot >= COMPACTEVERY
+
+
+def replay(game, entries):
+    """
+    Re-applies journaled actions to the game state (not the sprites).
+    -------------------------------------------------------
+    Parameters:
+        - game : Scene or main game object with an engine
+        - entries : action dicts from Journal.entries()
+    """
+    for entry in entries:
+        game.engine.apply(entry)
+    game.year, game.month, game.day = game.today.year, game.today.month, game.today.day
+
+
+def flush_saves(timeout=None):
+    """
+    Blocks until every queued save has been written to disk.
+    -------------------------------------------------------
+    Called when the game closes so no save is lost.
+    """
+    return _writer.flush(timeout)
+
+
+def load_game(game, slot=None):
+    """
+    Loads a slot's saved game state, replays its journal and
+    updates the game object and its sprites accordingly.
+    -------------------------------------------------------
+    The state is applied in bulk, then the calendar is refreshed
+    once and only sprites whose value changed are re-rendered.
+
     Parameters:
         - game : Scene or main game object to update.
+        - slot : slot to load, selecting it first (defaults to
+                 the active slot)
     
     Returns:
-        - True if a save file was found and loaded, False otherwise.
+        - True if a save file or journal was found and loaded, False
+          otherwise (including when the save was unreadable and set
+          aside).
     
     Updates:
         - game.today, game.year, game.month, game.day
@@ -71,12 +771,21 @@ def load_game(game):
         - Resource and building sprites' values and images
         - Refreshes the calendar
     """
-    if not os.path.exists(FILEPATH):
+    if slot is not None:
+        select_slot(slot)
+    flush_saves()
+    try:
+        data = read_state()
+    except ValueError as error:
+        path = _save_file()
+        print(f"Could not load {path}: {error}")
+        print(f"Moved it to {path}.corrupt and started a new game.")
+        _set_aside(path)
+        return False
+    if data is None and not os.path.exists(_journal.path):
         print("No save file found.")
         return False
-
-    with open(FILEPATH, 'r') as f:
-        data = json.load(f)
+    data = data or {}
 
     date = data.get("date", {})
 
@@ -85,7 +794,6 @@ def load_game(game):
     month = date.get("month", game.today.month)
     day   = date.get("day",   game.today.day)
 
-    from datetime import datetime
     game.today = datetime(year, month, day)
     game.year  = year
     game.month = month
@@ -97,21 +805,37 @@ def load_game(game):
     game.player.buildings    = player_data.get("buildings", game.player.buildings)
     game.player.actions_left = player_data.get("actions_left", game.player.actions_left)
 
-    # Update sprites
+    # Replay actions journaled after the snapshot
+    seq = data.get("seq", 0)
+    entries = _journal.entries(after=seq)
+    replay(game, entries)
+    _journal.seq = entries[-1]['seq'] if entries else seq
+    _journal.since_snapshot = len(entries)
+    _journal.compact(seq)   # drops a torn last line before appending again
+
+    # Re-render only the sprites whose state changed, each at most once
     game.refresh_calendar()
-    for resource_sprite in game.resource_group:
-        name = resource_sprite.name.lower()
-        resource_sprite.value = game.player.resources[name]
-        resource_sprite.update_image()
-
-    for building_sprite in game.building_group:
-        name = building_sprite.name.lower()
-        building_sprite.value = game.player.buildings[name]
-        building_sprite.update_image()
+    game.sync_player()
         
     print("Game Loaded.")
     return True
 
-def clear_save():
-    if os.path.exists(FILEPATH):
-        os.remove(FILEPATH)
+def clear_save(slot=None):
+    """
+    Deletes a slot's save, journal and index entry.
+    -------------------------------------------------------
+    Parameters:
+        - slot : slot to delete (defaults to the active slot)
+    """
+    slot = slot or _slot
+    path = slot_path(slot)
+    _writer.discard(path)
+    if slot == _slot:
+        _journal.clear()
+    elif os.path.exists(journal_path(slot)):
+        os.remove(journal_path(slot))
+    paths = (path,) + (LEGACYPATHS if slot == DEFAULTSLOT else ())
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+    _index.remove(slot)
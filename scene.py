@@ -4,25 +4,31 @@ scene.py
 Manages the game scene including calendar display, resource bar,
 player actions, and menus. Handles input, drawing, and updating
 all interactive and static elements within the game window.
+
+The game rules and state live in an engine.Engine; the scene is
+a view over it that forwards input and re-renders the result.
 """
 
 # Standard Library Imports
 import calendar
-from datetime import datetime, date, timedelta
+from datetime import datetime
 
 # Third-Party Imports
 import pygame
 
 # Personal Imports
 from sprites import Entity
-from calendar_sprites import DateBlock, WeekDay, Month, MonthButton
+from calendar_sprites import MonthButton, CalendarView, month_weeks
 from player_sprites import Resources, Buildings
-from interaction_sprites import SleepButton, Tooltip, ClearSave
-from player import Player
+from interaction_sprites import SleepButton, Tooltip, ClearSave, HintLabel
+from interaction import InteractionDispatcher
+from engine import Engine
 from tooltip import TOOLTIPS
 from globals import *
 from events import EventHandler
-from save_load import save_game, load_game
+from save_load import save_game, load_game, journal_action
+from planner import next_step
+from assets import load_image
 
 
 class Scene:
@@ -34,16 +40,28 @@ class Scene:
         - sprites : pygame.sprite.Group containing all sprites
         - button_group : group for interactive buttons
         - resource_group : group for resource sprites
-        - date_block_group : group for calendar day blocks
+        - calendar_view : CalendarView showing the composed current month
         - menus : group for active menus
         - building_group : group for building sprites
         - tooltip_group : group for tooltip sprites
-        - today : datetime object for the current game date
+        - render_group : LayeredDirty group holding every drawn sprite
+        - background : cached background surface repainted under dirty rects
+        - dirty_rects : screen rects changed by the last draw
+        - dispatcher : InteractionDispatcher routing clicks and hovers
+        - hint : HintLabel showing the planner's next step (toggled with H)
+        - hint_pending : True while the hint waits to be planned on an idle frame
+        - hint_key, hint_text : (player.version, actions_left) the hint
+          was last planned for, and its text
+        - engine : Engine holding the game state and rules
+        - today : datetime object for the current game date (engine.today)
         - year, month : current displayed year and month
         - weeks : calendar weeks for the current month
-        - player : Player object for resources, buildings, and actions
+        - player : Player object for resources, buildings, and actions (engine.player)
     """
 
+    # Modal UI that blocks clicks on the resource/building bars and clear save
+    MODALS = ('sleep', 'build_menu')
+
     def __init__(self, app):
         """
         Initializes the Scene, generates calendar, resource bar, building bar, tooltips,
@@ -57,140 +75,111 @@ class Scene:
         self.sprites = pygame.sprite.Group()
         self.button_group = pygame.sprite.Group()
         self.resource_group = pygame.sprite.Group()
-        self.date_block_group = pygame.sprite.Group()
         self.menus = pygame.sprite.Group()
         self.building_group = pygame.sprite.Group()
         self.tooltip_group = pygame.sprite.Group()
         self.interaction_group = pygame.sprite.Group()
+        self.render_group = pygame.sprite.LayeredDirty()
+        # Never switch to full-screen redraws after a slow frame
+        self.render_group.set_timing_threshold(float('inf'))
+
+        self.background = pygame.Surface((SCREENWIDTH, SCREENHEIGHT)).convert()
+        self.background.fill('lightblue')
+        self.render_group.clear(self.app.screen, self.background)
+        self.dirty_rects = []
+        self.dispatcher = InteractionDispatcher()
 
-        self.today = datetime.today()
+        self.engine = Engine(datetime.today())
         self.year, self.month = 2025, 11
-        self.weeks = calendar.Calendar().monthdayscalendar(self.year, self.month)
+        self.weeks = month_weeks(self.year, self.month)
         _, self.days_in_month = calendar.monthrange(self.year, self.month)
         
-        self.player = Player()
-        
         
         self.gen_cal()
         self.gen_resource_bar()
         self.gen_building_bar()
         self.gen_tooltips()
         self.create_clear_save_button()
+        self.hint = HintLabel([self.render_group],
+                              position=(SCREENWIDTH - BUILDINGOFFSETX, self.clear_save_button.rect.top))
+        self.hint_pending = False
+        self.hint_key = None
+        self.hint_text = ''
         
         
         self.sleeping = False
         load_game(self)
 
-    def gen_cal(self):
-        """
-        Builds the calendar by generating month, weekdays, and date blocks.
-        -------------------------------------------------------------
-        Called during initialization and calendar refresh.
-        """
-        font = pygame.font.SysFont(None, 28)
-        self.gen_month()
-        self.gen_weekdays(font)
-        self.gen_date_blocks(font)
+    @property
+    def player(self):
+        """Player simulated by the engine."""
+        return self.engine.player
 
-    def gen_weekdays(self, font):
-        """
-        Generates WeekDay sprites for each day of the week.
-        -------------------------------------------------------------
-        Parameters:
-            - font : pygame.font.Font instance for text rendering
-        """
-        day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        for col, name in enumerate(day_names):
-            x = col * (DATEWIDTH + 4) + CALENDAROFFSETX
-            y = CALENDAROFFSETY - 40
-            WeekDay([self.sprites], name=name, position=(x, y))
+    @player.setter
+    def player(self, player):
+        self.engine.player = player
+
+    @property
+    def today(self):
+        """Current game date, owned by the engine."""
+        return self.engine.today
 
-    def gen_date_blocks(self, font):
+    @today.setter
+    def today(self, today):
+        self.engine.today = today
+
+    def gen_cal(self):
         """
-        Generates DateBlock sprites for each day in the current month.
+        Builds the calendar view and month navigation buttons, then shows
+        the current month.
         -------------------------------------------------------------
-        Parameters:
-            - font : pygame.font.Font instance for day numbers
+        Called during initialization and reset.
         """
-        for row, week in enumerate(self.weeks):
-            for col, day in enumerate(week):
-                if day == 0:
-                    continue
-
-                block_date = date(self.year, self.month, day)
-                x = col * (DATEWIDTH + 4) + CALENDAROFFSETX
-                y = row * (DATEHEIGHT + 4) + CALENDAROFFSETY
-
-                if block_date == self.today.date():
-                    image = pygame.image.load('res/dateblock_present.png')
-                elif block_date < self.today.date():
-                    image = pygame.image.load('res/dateblock_past.png')
-                else:
-                    image = pygame.image.load('res/dateblock.png')
-
-                image = pygame.transform.scale(image, (DATEWIDTH, DATEHEIGHT))
-                block = DateBlock([self.date_block_group], image=image, position=(x, y))
-
-                text = font.render(str(day), True, 'black')
-                block.image.blit(text, (10, 10))
+        self.calendar_view = CalendarView([self.sprites, self.render_group])
+        self.gen_month_buttons()
+        self.refresh_calendar()
 
-    def gen_month(self):
+    def gen_month_buttons(self):
         """
-        Generates Month display and month navigation buttons.
+        Generates the month navigation buttons beside the month title.
         -------------------------------------------------------------
         """
-        month_name = calendar.month_name[self.month] + ' ' + str(self.year)
-        x = SCREENWIDTH // 4
-        y = int(CALENDAROFFSETY - DATEHEIGHT - 15)
-
-        month = Month([self.sprites], name=month_name, position=(x, y))
-        MonthButton([self.sprites, self.button_group], name='month_forward',
-                    image=pygame.image.load('res/forward_arrow.png'),
-                    position=(month.rect.right + MONTHBUTTONOFFSET, month.rect.centery))
-        MonthButton([self.sprites, self.button_group], name='month_back',
-                    image=pygame.image.load('res/back_arrow.png'),
-                    position=(month.rect.left - MONTHBUTTONOFFSET, month.rect.centery))
+        title = self.calendar_view.title_rect
+        forward = MonthButton([self.sprites, self.button_group, self.render_group], name='month_forward',
+                              image=load_image('res/forward_arrow.png'),
+                              position=(title.right + MONTHBUTTONOFFSET, title.centery))
+        back = MonthButton([self.sprites, self.button_group, self.render_group], name='month_back',
+                           image=load_image('res/back_arrow.png'),
+                           position=(title.left - MONTHBUTTONOFFSET, title.centery))
+        self.dispatcher.register(forward, on_click=lambda: self.change_month(1), blocked_by=('build_menu',))
+        self.dispatcher.register(back, on_click=lambda: self.change_month(-1), blocked_by=('build_menu',))
 
     def gen_resource_bar(self):
         """
         Generates the top resource bar with icons and current values.
         -------------------------------------------------------------
-        Called during initialization.
+        Called during initialization. Each sprite renders its own icon
+        and counter from the glyph cache.
         """
-        resources = [name for name in self.player.resources]
-        font = pygame.font.SysFont(None, 32)
-        for col, name in enumerate(resources):
+        for col, name in enumerate(self.player.resources):
             x = col * (RESOURCEWIDTH + RESOURCEPADDING) + RESOURCEOFFSETX
             y = RESOURCEOFFSETY
-            image = pygame.image.load(f'res/{name.lower()}.png')
-            image = pygame.transform.scale(image, (RESOURCEWIDTH, RESOURCEHEIGHT))
-            value = self.player.resources[name.lower()]
-            text_surf = font.render(f"{name} :    {value}", True, 'black')
-            text_rect = text_surf.get_rect(midright=(RESOURCEWIDTH - 25, RESOURCEHEIGHT // 2))
-            image.blit(text_surf, text_rect)
-
-            Resources([self.resource_group], scene=self, player=self.player,
-                      name=name.lower(), image=image, position=(x, y))
+            sprite = Resources([self.resource_group, self.render_group], scene=self, player=self.player,
+                               name=name, position=(x, y))
+            self.dispatcher.register(sprite, on_click=sprite.gather, blocked_by=self.MODALS)
 
     def gen_building_bar(self):
         """
         Generates the building bar with all player's building icons and values.
         -------------------------------------------------------------
+        Each sprite renders its own icon and counter from the glyph cache.
         """
-        buildings = [name for name in self.player.buildings]
-        font = pygame.font.SysFont(None, 20)
-        for col, name in enumerate(buildings):
+        for col, name in enumerate(self.player.buildings):
             x = col * (BUILDINGWIDTH + BUILDINGPADDING) + BUILDINGOFFSETX
             y = (RESOURCEHEIGHT + RESOURCEOFFSETY) + BUILDINGOFFSETY
-            image = pygame.image.load(f'res/{name.lower()}.png')
-            image = pygame.transform.scale(image, (BUILDINGWIDTH, BUILDINGHEIGHT))
-            value = self.player.buildings[name.lower()]
-            text_surf = font.render(f'{name} :    {value}', True, 'black')
-            text_rect = text_surf.get_rect(midright=(BUILDINGWIDTH - 25, BUILDINGHEIGHT // 2))
-            image.blit(text_surf, text_rect)
-
-            Buildings([self.building_group], player=self.player, scene=self,
-                      name=name.lower(), image=image, position=(x, y), value=value)
+            sprite = Buildings([self.building_group, self.render_group], player=self.player, scene=self,
+                               name=name, position=(x, y), value=self.player.buildings[name])
+            self.dispatcher.register(sprite, on_click=sprite.purchase, blocked_by=self.MODALS)
 
     def gen_tooltips(self):
         """
@@ -198,19 +187,19 @@ class Scene:
         -------------------------------------------------------------
         Called during scene setup after sprites are created.
         """
-        self.tooltip_group = pygame.sprite.Group()
-
         for resource_icon in self.resource_group:
             tooltip_callable = TOOLTIPS['resource'].get(resource_icon.name.lower())
             if tooltip_callable:
-                Tooltip(groups=[self.tooltip_group], icon=resource_icon,
-                        text=tooltip_callable, player=self.player)
+                tooltip = Tooltip(groups=[self.tooltip_group, self.render_group], icon=resource_icon,
+                                  text=tooltip_callable, player=self.player)
+                self.dispatcher.register(resource_icon, on_hover=tooltip.show, on_leave=tooltip.hide)
 
         for building_icon in getattr(self, 'building_group', []):
             tooltip_callable = TOOLTIPS['building'].get(building_icon.name.lower())
             if tooltip_callable:
-                Tooltip(groups=[self.tooltip_group], icon=building_icon,
-                        text=tooltip_callable, player=self.player)
+                tooltip = Tooltip(groups=[self.tooltip_group, self.render_group], icon=building_icon,
+                                  text=tooltip_callable, player=self.player)
+                self.dispatcher.register(building_icon, on_hover=tooltip.show, on_leave=tooltip.hide)
                 
     def create_clear_save_button(self):
         for sprite in self.building_group:
@@ -220,68 +209,46 @@ class Scene:
         clear_save_x = lumber_yard_sprite.rect.left
         clear_save_y = lumber_yard_sprite.rect.bottom + 10
 
-        self.clear_save_button = ClearSave([self.interaction_group], scene=self, position=(clear_save_x, clear_save_y))
+        self.clear_save_button = ClearSave([self.interaction_group, self.render_group], scene=self,
+                                           position=(clear_save_x, clear_save_y))
+        self.dispatcher.register(self.clear_save_button, on_click=self.clear_save_button.on_click,
+                                 blocked_by=self.MODALS)
 
 
-    def change_month(self):
+    def change_month(self, step):
         """
-        Handles month navigation input (forward/back) and refreshes the calendar.
+        Moves the displayed month forward or back and refreshes the calendar.
         -------------------------------------------------------------
-        Uses EventHandler for mouse click detection.
-        """
-        if hasattr(self, 'build_menu'):
-            return
-        mouse_pos = pygame.mouse.get_pos()
-        if not EventHandler.clicked_any():
-            return
-        for button in self.button_group:
-            if not button.rect.collidepoint(mouse_pos):
-                continue
-            if button.name == 'month_forward' and EventHandler.clicked(1):
-                if self.month < 12:
-                    self.month += 1
-                else:
-                    self.month = 1
-                    self.year += 1
-                self.refresh_calendar()
-            if button.name == 'month_back' and EventHandler.clicked(1):
-                if self.month > 1:
-                    self.month -= 1
-                else:
-                    self.month = 12
-                    self.year -= 1
-                self.refresh_calendar()
+        Click handler for the month_forward / month_back buttons.
+
+        Parameters:
+            - step : 1 for the next month, -1 for the previous month
+        """
+        if step > 0:
+            if self.month < 12:
+                self.month += 1
+            else:
+                self.month = 1
+                self.year += 1
+        else:
+            if self.month > 1:
+                self.month -= 1
+            else:
+                self.month = 12
+                self.year -= 1
+        self.refresh_calendar()
 
     def refresh_calendar(self):
         """
-        Rebuilds calendar sprites for the current month.
+        Shows the current month in the calendar view.
         -------------------------------------------------------------
-        Clears old sprites and regenerates the calendar.
+        Months already rendered for the current day are a cache hit, so
+        navigating back and forth only swaps the view's image.
         """
-        self.sprites.empty()
-        self.button_group.empty()
-        self.date_block_group.empty()
-        self.weeks = calendar.Calendar().monthdayscalendar(self.year, self.month)
-        self.gen_cal()
+        self.weeks = month_weeks(self.year, self.month)
+        self.calendar_view.show(self.year, self.month, self.today.date())
         self.sleeping = False
 
-    def gather_resource(self):
-        """
-        Processes clicks on resource sprites to collect them.
-        -------------------------------------------------------------
-        """
-        for resource in self.resource_group:
-            resource.gather()
-
-    def purchase_building(self):
-        """
-        Processes clicks on building sprites to purchase them.
-        -------------------------------------------------------------
-        """
-        for building in self.building_group:
-            building.purchase()
-        
-
     def update_resource(self, resource):
         """
         Updates a single resource sprite to match player's current value.
@@ -292,98 +259,168 @@ class Scene:
         resource.value = self.player.resources[resource.name]
         resource.update_image()
 
+    def sync_player(self):
+        """
+        Re-renders only the sprites whose state changed since the last sync.
+        -------------------------------------------------------------
+        Takes the player's dirty resource and building names: each changed
+        resource sprite is re-rendered, and building sprites are refreshed
+        with their count and (when resources changed) affordability, which
+        re-renders only those whose display actually differs.
+        """
+        resources, buildings = self.player.take_changes()
+        for sprite in self.resource_group:
+            if sprite.name in resources:
+                self.update_resource(sprite)
+        if not resources and not buildings:
+            return
+        counts = self.player.buildings
+        status = self.player.affordability() if resources else None
+        for sprite in self.building_group:
+            if status is not None or sprite.name in buildings:
+                sprite.refresh(counts[sprite.name],
+                               status.of(sprite.name)[:2] if status is not None else sprite.status)
+
     def update_sleep_button(self):
         """
         Shows or hides the sleep button depending on remaining player actions.
+        While shown, the sleep button is modal: it blocks clicks on MODALS targets.
         -------------------------------------------------------------
         """
         if self.player.actions_left <= 0:
-            image = pygame.image.load('res/sleep.png')
-            image = pygame.transform.scale(image, (RESOURCEWIDTH, RESOURCEHEIGHT))
-            if not hasattr(self, 'sleep_button'):
-                self.sleep_button = SleepButton([self.sprites], image=image,
+            # A reset kills the button along with self.sprites
+            if not hasattr(self, 'sleep_button') or not self.sleep_button.alive():
+                image = load_image('res/sleep.png', (RESOURCEWIDTH, RESOURCEHEIGHT)).copy()
+                self.sleep_button = SleepButton([self.sprites, self.render_group], image=image,
                                                 position=(SCREENWIDTH // 2, SCREENHEIGHT * .8))
+                self.dispatcher.register(self.sleep_button, on_click=self.handle_sleep)
+                self.dispatcher.block('sleep')
         else:
             if hasattr(self, 'sleep_button'):
                 self.sleep_button.kill()
                 del self.sleep_button
+                self.dispatcher.unblock('sleep')
 
     def handle_sleep(self):
         """
         Handles sleep button click to advance the day and reset actions.
         -------------------------------------------------------------
+        Click handler for the sleep button.
+        """
+        print(f"Player slept, day advanced. {self.month}, {self.today}")
+        self.fast_forward(1)
+        print(self.player.resources)
+
+    def fast_forward(self, days):
+        """
+        Sleeps through days at once, journals it and saves.
+        -------------------------------------------------------------
+        The engine computes the result in closed form and the view is
+        re-rendered once, so skipping a year costs the same as a night.
+
+        Parameters:
+            - days : int >= 1, number of days to skip
         """
-        if hasattr(self, 'sleep_button'):
-            mouse_pos = pygame.mouse.get_pos()
-            if self.sleep_button.rect.collidepoint(mouse_pos) and EventHandler.clicked(1):
-                if hasattr(self, 'build_menu'):
-                    self.build_menu.kill()
-                    del self.build_menu
-                print(f"Player slept, day advanced. {self.month}, {self.today}")
-                self.advance_day()
-                save_game(self)
-                print(self.player.resources)
+        if hasattr(self, 'build_menu'):
+            self.build_menu.kill()
+            del self.build_menu
+            self.dispatcher.unblock('build_menu')
+        self.advance_day(days)
+        self.record_action('sleep', days=days)
+        save_game(self)
 
-    def advance_day(self):
+    def advance_day(self, days=1):
         """
-        Advances the game day by one, updates resources from buildings,
+        Advances the game by days, updates resources from buildings,
         refreshes the calendar, and resets player actions.
         -------------------------------------------------------------
+        The calendar and resource bar are re-rendered once at the end.
         """
         self.sleeping = True
-        self.today += timedelta(days=1)
+        self.engine.fast_forward(days)
         self.year, self.month, self.day = self.today.year, self.today.month, self.today.day
-        self.weeks = calendar.Calendar().monthdayscalendar(self.year, self.month)
-
-        r = self.player.resources
-        b = self.player.buildings
-        r['wood'] += 1 * b['lumber_yard']
-        r['stone'] += 1 * b['quarry']
-        r['iron'] += 1 * b['iron_mine']
-        r['gold'] += 1 * b['gold_mine']
-        r['food'] += 1 * b['farm']
 
         self.refresh_calendar()
+        self.sync_player()
 
-        for resource_sprite in self.resource_group:
-            resource_sprite.value = r[resource_sprite.name]
-            resource_sprite.update_image()
-
-        self.player.reset_actions()
+    def record_action(self, action, **fields):
+        """
+        Journals a player action so it survives a crash before the next save.
+        -------------------------------------------------------------
+        Every COMPACTEVERY actions a full snapshot is saved, which lets the
+        journal be compacted.
 
-    def clear_save(self):
-        self.clear_save_button.on_click()
+        Parameters:
+            - action : 'gather', 'build', 'sleep' or 'reset'
+            - fields : action arguments (resource, building, date)
+        """
+        if journal_action(action, **fields):
+            save_game(self)
+        if self.hint.visible:
+            self.refresh_hint()
+
+    def toggle_hint(self):
+        """Shows or hides the planner's suggested next action (H key)."""
+        if self.hint.visible:
+            self.hint.hide()
+        else:
+            fresh = self.hint_key == (self.player.version, self.player.actions_left)
+            self.hint.show(self.hint_text if fresh else "Planning...")
+            self.refresh_hint()
+
+    def refresh_hint(self):
+        """Queues the hint to be planned on the next frame without input."""
+        self.hint_pending = True
+
+    def plan_hint(self):
+        """
+        Suggests a step toward owning one more HINTBUILDING and shows it.
+        The plan is near-minimal in days, not the fastest possible: the
+        planner searches build orders only, gathers greedily and, past
+        HINTMAXSTATES or HINTMAXSECONDS, falls back to the plan without
+        helper buildings. It is skipped while the player is unchanged.
+        """
+        self.hint_pending = False
+        key = (self.player.version, self.player.actions_left)
+        if key != self.hint_key:
+            goal = {HINTBUILDING: self.player.buildings[HINTBUILDING] + 1}
+            name = HINTBUILDING.replace('_', ' ').title()
+            step = next_step(self.player, goal, HINTMAXSTATES, HINTMAXSECONDS)
+            self.hint_key = key
+            self.hint_text = f"Toward the next {name}: {step}"
+        if self.hint.visible:
+            self.hint.show(self.hint_text)
 
     def reset(self):
         """Fully resets the game state after clearing save data."""
         
-        # Reset date
-        from datetime import datetime
-        self.today = datetime.today()
+        # Fresh player on today's date
+        self.engine.reset(datetime.today())
         self.year = self.today.year
         self.month = self.today.month
         self.day = self.today.day
 
-        # Brand-new player
-        self.player = Player()
-
         # Clear all existing sprite groups
-        self.sprites.empty()
-        self.resource_group.empty()
-        self.building_group.empty()
-        self.date_block_group.empty()
-        self.button_group.empty()
-        self.tooltip_group.empty()
-        self.menus.empty()
+        self.kill_sprites(self.sprites, self.resource_group, self.building_group,
+                          self.button_group, self.tooltip_group,
+                          self.menus)
 
         # Regenerate everything
         self.gen_cal()
         self.gen_resource_bar()
         self.gen_building_bar()
         self.gen_tooltips()
+        self.player.take_changes()     # the new sprites already show the reset state
 
         # Recreate clear save button
-        self.clear_save_button = ClearSave([self.interaction_group], scene=self,position=self.clear_save_button.rect.topleft)
+        position = self.clear_save_button.rect.topleft
+        self.clear_save_button.kill()
+        self.clear_save_button = ClearSave([self.interaction_group, self.render_group], scene=self,
+                                           position=position)
+        self.dispatcher.register(self.clear_save_button, on_click=self.clear_save_button.on_click,
+                                 blocked_by=self.MODALS)
+
+        self.record_action('reset', date=self.today.date().isoformat())
 
     print("Game state reset.")
 
@@ -394,34 +431,62 @@ class Scene:
         Updates the scene and all interactive elements each frame.
         -------------------------------------------------------------
         Responsibilities:
-            - Handles resource and building clicks
-            - Updates month navigation
+            - Toggles the planner hint on H
+            - Dispatches a left click to the one sprite under it
+              (resources, buildings, month navigation, sleep, clear save)
             - Updates sprites, sleep button, and menus
-            - Updates tooltips
+            - Updates tooltips when the mouse moved or something was clicked
+            - Plans a queued hint, or else renders one neighbouring month
+              ahead, on frames without input
         """
         EventHandler.click_consumed = False
-        self.gather_resource()
-        self.purchase_building()
-        self.change_month()
+        if EventHandler.keydown(pygame.K_h):
+            self.toggle_hint()
+        click_pos = EventHandler.click_pos(1)
+        if click_pos is not None:
+            self.dispatcher.click(click_pos)
+            EventHandler.click_consumed = True
         self.sprites.update()
         self.update_sleep_button()
-        self.handle_sleep()
         self.menus.update()
-        self.tooltip_group.update()
-        self.clear_save()
+        self.interaction_group.update()
+        if EventHandler.events:
+            self.dispatcher.hover(EventHandler.mouse_pos())
+        elif self.hint_pending:
+            self.plan_hint()
+        else:
+            self.calendar_view.prefetch_step()
+
+    def has_pending_work(self):
+        """
+        Returns True while background work (a queued hint or month
+        prefetching) is pending, so the main loop keeps running frames
+        instead of blocking.
+        """
+        return self.hint_pending or bool(self.calendar_view.prefetch_queue)
+
+    def kill_sprites(self, *groups):
+        """
+        Removes every sprite in the given groups from all of its groups.
+        -------------------------------------------------------------
+        Unlike Group.empty(), this also drops the sprites from render_group
+        so the area they covered is repainted with the background.
+        """
+        for group in groups:
+            for sprite in group.sprites():
+                sprite.kill()
 
     def draw(self):
         """
-        Draws the scene and all sprites to the screen.
+        Draws the sprites that changed since the last frame.
         -------------------------------------------------------------
+        Only dirty sprites (and whatever overlaps them) are repainted over
+        the cached background; the first frame paints the full screen.
+
+        Returns:
+            - list of pygame.Rect screen areas that changed
         """
-        self.app.screen.fill('lightblue')
-        self.date_block_group.draw(self.app.screen)
-        self.sprites.draw(self.app.screen)
-        self.resource_group.draw(self.app.screen)
-        self.building_group.draw(self.app.screen)
-        self.interaction_group.draw(self.app.screen)
-        self.tooltip_group.draw(self.app.screen)
-        self.menus.draw(self.app.screen)
+        self.dirty_rects = self.render_group.draw(self.app.screen)
+        return self.dirty_rects
         
         
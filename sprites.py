@@ -1,26 +1,29 @@
 """
 sprites.py
 -------------------------------------------------------
-Entity(Sprite): Superclass for all game sprites.
+Entity(DirtySprite): Superclass for all game sprites.
+    - image / rect: Assigning either marks the sprite dirty so the
+      scene's LayeredDirty group repaints only what changed.
     - update(): Placeholder for entity-specific updates.
 """
 
 import pygame
-from pygame.sprite import Sprite
+from pygame.sprite import DirtySprite
 
 from events import EventHandler
 from globals import *
 from player import Player
 from tooltip import TOOLTIPS
 
-class Entity(Sprite):
+class Entity(DirtySprite):
     """Super Class to represent all sprites on the screen."""
+
     def __init__(self, groups, image=None, position= (0, 0)):
         super().__init__(groups)
         """
         Base class for all visible objects in the game.
         ---------------------------------------------------
-        Inherited : pygame.sprite.Sprite
+        Inherited : pygame.sprite.DirtySprite
 
         Parameters:
             - groups : List of sprite groups to which this sprite belongs
@@ -34,8 +37,31 @@ class Entity(Sprite):
         self.image = image
         self.rect = self.image.get_rect(topleft = position)
 
+    @property
+    def image(self):
+        """Surface drawn for this sprite."""
+        return self._image
+
+    @image.setter
+    def image(self, image):
+        self._image = image
+        self.dirty = 1
+
+    @property
+    def rect(self):
+        """
+        Screen rect of this sprite. Assign a new rect (rather than
+        mutating this one in place) so the move gets repainted.
+        """
+        return self._rect
+
+    @rect.setter
+    def rect(self, rect):
+        self._rect = rect
+        self.dirty = 1
+
     def update(self):
-        
+
         """
         Placeholder for entity-specific updates.
         ---------------------------------------------------
@@ -0,0 +1,68 @@
+"""
+conftest.py
+-------------------------------------------------------
+Shared pytest setup: puts the game modules (which live in
+the repository root) on sys.path, and isolates save files.
+
+Fixtures:
+
+saves(tmp_path, monkeypatch):
+    Runs a test in an empty directory with save_load reset to
+    the default slot, so it never touches real saves.
+
+Game:
+    Minimal stand-in for the Scene that load_game() and replay()
+    update: an Engine plus the date fields and refresh hooks.
+"""
+
+# Standard Library Imports
+import os
+import sys
+from datetime import datetime
+
+# Third Party Imports
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# My Imports
+import save_load
+from engine import Engine
+
+
+class Game:
+    """Headless stand-in for Scene in save/load tests."""
+
+    def __init__(self, today=datetime(2025, 11, 1)):
+        self.engine = Engine(today)
+        self.player = self.engine.player
+        self.year, self.month, self.day = today.year, today.month, today.day
+
+    @property
+    def today(self):
+        return self.engine.today
+
+    @today.setter
+    def today(self, value):
+        self.engine.today = value
+
+    def refresh_calendar(self):
+        pass
+
+    def sync_player(self):
+        self.player.take_changes()
+
+
+@pytest.fixture
+def saves(tmp_path, monkeypatch):
+    """Empty working directory with save_load on a fresh default slot."""
+    monkeypatch.chdir(tmp_path)
+    save_load.flush_saves()
+    save_load._journal.close()
+    monkeypatch.setattr(save_load, '_slot', save_load.DEFAULTSLOT)
+    monkeypatch.setattr(save_load, '_journal',
+                        save_load.Journal(save_load.journal_path(save_load.DEFAULTSLOT)))
+    monkeypatch.setattr(save_load, '_index', save_load.SaveIndex(save_load.INDEXPATH))
+    yield tmp_path
+    save_load.flush_saves()
+    save_load._journal.close()
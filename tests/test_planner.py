@@ -0,0 +1,74 @@
+"""
+test_planner.py
+-------------------------------------------------------
+Tests for planner: plans must be playable under the game
+rules, reach their goal in the days they report, and respect
+the search budget.
+"""
+
+# Standard Library Imports
+
+# Third Party Imports
+import pytest
+
+# My Imports
+import planner
+from engine import Engine
+
+
+def play(actions):
+    """Plays a plan on a fresh Engine and returns it with the days slept."""
+    engine = Engine()
+    days = 0
+    for kind, name in actions:
+        if kind == 'gather':
+            assert engine.player.actions_left > 0
+            engine.gather(name)
+        elif kind == 'build':
+            assert engine.build(name), f"could not afford {name}"
+        else:
+            engine.sleep()
+            days += 1
+    return engine, days
+
+
+@pytest.mark.parametrize('count, days', [(1, 9), (2, 14)])
+def test_plan_reaches_goal_in_reported_days(count, days):
+    result = planner.plan(Engine().player, {'town_hall': count})
+    assert result.days == days
+    engine, slept = play(result.actions)
+    assert slept == result.days
+    assert engine.player.buildings['town_hall'] == count
+
+
+def test_plan_no_slower_than_helper_free_plan():
+    goal = {'town_hall': 3}
+    best = planner.plan(Engine().player, goal)
+    greedy = planner.plan(Engine().player, goal, max_states=0, fallback=True)
+    assert best.days <= greedy.days
+    assert play(greedy.actions)[0].player.buildings['town_hall'] == 3
+
+
+def test_goal_already_met():
+    result = planner.plan(Engine().player, {'town_hall': 0})
+    assert result.actions == [] and result.days == 0
+    assert planner.next_step(Engine().player, {'town_hall': 0}) == "Goal reached!"
+
+
+def test_budget_exhausted():
+    player = Engine().player
+    goal = {'town_hall': 4}
+    assert planner.plan(player, goal, max_seconds=0) is None
+    result = planner.plan(player, goal, max_seconds=0, fallback=True)
+    assert play(result.actions)[0].player.buildings['town_hall'] == 4
+
+
+def test_out_of_reach():
+    player = Engine().player
+    assert planner.plan(player, {'town_hall': 1}, max_days=3) is None
+    assert planner.plan(player, {'town_hall': 1}, max_days=3, fallback=True) is None
+
+
+def test_next_step_text():
+    assert planner.next_step(Engine().player, {'town_hall': 1}) == \
+        "Gather Wood (about 9 days to goal)"
@@ -0,0 +1,198 @@
+"""
+test_save_load.py
+-------------------------------------------------------
+Tests for save_load: the binary snapshot format, schema
+migrations, journal replay and compaction, and unreadable
+saves.
+"""
+
+# Standard Library Imports
+import json
+import os
+import struct
+
+# Third Party Imports
+import pytest
+
+# My Imports
+import save_load
+from conftest import Game
+from player import RESOURCES, BUILDINGS
+
+
+def make_state(**player):
+    return {
+        'version' : save_load.SAVEVERSION,
+        'seq' : 42,
+        'date' : {'year': 2025, 'month': 12, 'day': 31},
+        'player' : {
+            'resources'    : {name: 10 ** i for i, name in enumerate(RESOURCES)},
+            'buildings'    : {name: i for i, name in enumerate(BUILDINGS)},
+            'actions_left' : 3,
+            **player
+        }
+    }
+
+
+def test_binary_round_trip():
+    state = make_state()
+    payload = save_load.encode_state(state)
+    assert payload.startswith(save_load.MAGIC)
+    assert save_load.decode_state(payload) == state
+    assert save_load.decode(payload) == state
+
+
+def test_binary_round_trip_large_counts():
+    state = make_state(resources={name: 2 ** 40 for name in RESOURCES})
+    assert save_load.decode_state(save_load.encode_state(state)) == state
+
+
+@pytest.mark.parametrize('cut', [0, 4, save_load.HEADER.size, save_load.HEADER.size + 3, -1])
+def test_truncated_binary_raises_value_error(cut):
+    payload = save_load.encode_state(make_state())
+    with pytest.raises(ValueError):
+        save_load.decode_state(payload[:cut])
+
+
+def test_mismatched_counts_raise_value_error():
+    payload = bytearray(save_load.encode_state(make_state()))
+    struct.pack_into('<B', payload, 6, len(RESOURCES) - 1)
+    with pytest.raises(ValueError, match='resources'):
+        save_load.decode_state(bytes(payload))
+
+
+def test_migrates_legacy_json():
+    legacy = {
+        'date' : {'year': 2025, 'month': 11, 'day': 3},
+        'player' : {'resources': {'wood': 4}, 'buildings': {'house': 1}, 'actions_left': 2}
+    }
+    state = save_load.migrate(save_load.decode(json.dumps(legacy).encode()))
+    assert state['version'] == save_load.SAVEVERSION
+    assert state['seq'] == 0
+    assert state['player']['resources'] == dict.fromkeys(RESOURCES, 0) | {'wood': 4}
+    assert state['player']['buildings'] == dict.fromkeys(BUILDINGS, 0) | {'house': 1}
+
+
+def test_newer_version_is_rejected():
+    with pytest.raises(ValueError, match='newer'):
+        save_load.migrate(make_state() | {'version': save_load.SAVEVERSION + 1})
+
+
+def test_journal_numbering_and_compaction(saves):
+    journal = save_load.Journal('test.journal')
+    for resource in ('wood', 'stone', 'iron'):
+        journal.record('gather', resource=resource)
+    assert [entry['seq'] for entry in journal.entries()] == [1, 2, 3]
+    assert [entry['resource'] for entry in journal.entries(after=1)] == ['stone', 'iron']
+
+    journal.compact(2)
+    assert [entry['seq'] for entry in journal.entries()] == [3]
+    journal.record('sleep')
+    assert journal.seq == 4
+    journal.close()
+
+    reopened = save_load.Journal('test.journal', seq=2)
+    assert (reopened.seq, reopened.since_snapshot) == (4, 2)
+
+
+def test_journal_ignores_torn_line(saves):
+    journal = save_load.Journal('test.journal')
+    journal.record('gather', resource='wood')
+    journal.close()
+    with open('test.journal', 'a') as f:
+        f.write('{"seq":2,"act')
+    assert [entry['seq'] for entry in journal.entries()] == [1]
+
+
+def test_load_replays_journal_after_snapshot(saves):
+    game = Game()
+    game.player.gather('wood')
+    save_load.save_game(game)
+    save_load.flush_saves()
+    for _ in range(2):
+        game.player.gather('stone')
+        save_load.journal_action('gather', resource='stone')
+    game.engine.sleep()
+    save_load.journal_action('sleep')
+
+    loaded = Game()
+    assert save_load.load_game(loaded)
+    assert dict(loaded.player.resources) == dict(game.player.resources)
+    assert loaded.player.actions_left == game.player.actions_left
+    assert loaded.today == game.today
+    assert save_load._journal.seq == 3
+
+
+def test_snapshot_compacts_journal(saves):
+    game = Game()
+    save_load.journal_action('gather', resource='wood')
+    game.player.gather('wood')
+    save_load.save_game(game)
+    save_load.flush_saves()
+    assert save_load._journal.entries() == []
+    assert save_load.read_state()['seq'] == 1
+
+
+def test_corrupt_save_is_set_aside(saves):
+    os.makedirs(save_load.SAVEDIR)
+    path = save_load.slot_path()
+    with open(path, 'wb') as f:
+        f.write(save_load.encode_state(make_state())[:10])
+    with open(save_load.journal_path(), 'w') as f:
+        f.write('{"seq":43,"action":"sleep"}\n')
+
+    game = Game()
+    assert not save_load.load_game(game)
+    assert os.path.exists(f"{path}.corrupt")
+    assert os.path.exists(f"{save_load.journal_path()}.corrupt")
+    assert not os.path.exists(path)
+    assert save_load._journal.seq == 0
+
+
+def save_slot(slot, wood):
+    game = Game()
+    for _ in range(wood):
+        game.player.gather('wood')
+    save_load.save_game(game, slot)
+    save_load.flush_saves()
+
+
+def test_index_lists_slots_without_reading_saves(saves):
+    save_slot('alpha', 1)
+    save_slot('beta', 2)
+    listed = save_load.list_slots()
+    assert [slot for slot, _ in listed] == ['beta', 'alpha']
+    assert listed[0][1]['resources']['wood'] == 2
+    assert listed[0][1]['date'] == '2025-11-01'
+
+    os.remove(save_load.slot_path('alpha'))     # the index alone answers
+    assert sorted(save_load.SaveIndex(save_load.INDEXPATH).slots()) == ['alpha', 'beta']
+
+
+def test_index_rebuilt_from_slot_files(saves):
+    save_slot('alpha', 1)
+    save_slot('beta', 2)
+    os.remove(save_load.INDEXPATH)
+    rebuilt = save_load.SaveIndex(save_load.INDEXPATH).slots()
+    assert sorted(rebuilt) == ['alpha', 'beta']
+    assert rebuilt['beta']['resources']['wood'] == 2
+
+
+def test_index_lists_legacy_save_as_default_slot(saves):
+    save_slot('alpha', 1)   # index.json written before the legacy save is seen
+    with open(save_load.LEGACYPATHS[1], 'w') as f:
+        json.dump({'date': {'year': 2025, 'month': 11, 'day': 5},
+                   'player': {'resources': {'wood': 7}, 'buildings': {}, 'actions_left': 3}}, f)
+    index = save_load.SaveIndex(save_load.INDEXPATH)
+    assert sorted(index.slots()) == ['alpha', save_load.DEFAULTSLOT]
+    assert index.slots()[save_load.DEFAULTSLOT]['resources']['wood'] == 7
+
+    save_load.clear_save(save_load.DEFAULTSLOT)
+    assert sorted(save_load.SaveIndex(save_load.INDEXPATH).slots()) == ['alpha']
+
+
+def test_clear_save_drops_slot(saves):
+    save_slot('alpha', 1)
+    save_load.clear_save('alpha')
+    assert save_load.list_slots() == []
+    assert not os.path.exists(save_load.slot_path('alpha'))
@@ -21,6 +21,17 @@ def format_cost(cost):
     """Return a compact single-line string showing non-zero costs."""
     return " | ".join(f"{k.capitalize()}: {v}" for k, v in cost.items() if v > 0)
 
+def format_affordability(player, name):
+    """Return a line saying how many of a building the player can buy, or when it will be affordable."""
+    affordable, buildable, _ = player.affordability().of(name)
+    if affordable:
+        return f"Can build: {buildable}"
+    days = player.days_until_affordable(name)
+    if days is None:
+        short = player.unproduced_shortfall(name)
+        return f"Not enough {short.capitalize()}, and none is produced"
+    return f"Affordable in {days} day{'s' if days != 1 else ''} from production"
+
 TOOLTIPS = {
     'resource': {
         'wood': lambda player: (
@@ -55,45 +66,52 @@ TOOLTIPS = {
             "Lumber Yard\n"
             "Produces one wood per day.\n"
             f"Current Lumber Yards: {player.buildings['lumber_yard']}\n"
-            f"Cost:\n | {format_cost(BUILDINGCOSTS['lumber_yard'])} |"
+            f"Cost:\n | {format_cost(BUILDINGCOSTS['lumber_yard'])} |\n"
+            f"{format_affordability(player, 'lumber_yard')}"
         ),
         'quarry': lambda player: (
             "Quarry\n"
             "Produces one stone per day.\n"
             f"Current Quarries: {player.buildings['quarry']}\n"
-            f"Cost:\n | {format_cost(BUILDINGCOSTS['quarry'])} |"
+            f"Cost:\n | {format_cost(BUILDINGCOSTS['quarry'])} |\n"
+            f"{format_affordability(player, 'quarry')}"
         ),
         'iron_mine': lambda player: (
             "Iron Mine\n"
             "Produces one iron per day.\n"
             f"Current Iron Mines: {player.buildings['iron_mine']}\n"
-            f"Cost:\n | {format_cost(BUILDINGCOSTS['iron_mine'])} |"
+            f"Cost:\n | {format_cost(BUILDINGCOSTS['iron_mine'])} |\n"
+            f"{format_affordability(player, 'iron_mine')}"
         ),
         'gold_mine': lambda player: (
             "Gold Mine\n"
             "Produces one gold per day.\n"
             f"Current Gold Mines: {player.buildings['gold_mine']}\n"
-            f"Cost:\n | {format_cost(BUILDINGCOSTS['gold_mine'])} |"
+            f"Cost:\n | {format_cost(BUILDINGCOSTS['gold_mine'])} |\n"
+            f"{format_affordability(player, 'gold_mine')}"
         ),
         'farm': lambda player: (
             "Farm\n"
             "Produces one food per day.\n"
             f"Current Farms: {player.buildings['farm']}\n"
-            f"Cost:\n | {format_cost(BUILDINGCOSTS['farm'])} |"
+            f"Cost:\n | {format_cost(BUILDINGCOSTS['farm'])} |\n"
+            f"{format_affordability(player, 'farm')}"
         ),
         'house': lambda player: (
             "House\n"
             "Provides more workers.\n"
             "Gathering resources yields one extra resource.\n"
             f"Current Houses: {player.buildings['house']}\n"
-            f"Cost:\n | {format_cost(BUILDINGCOSTS['house'])} |"
+            f"Cost:\n | {format_cost(BUILDINGCOSTS['house'])} |\n"
+            f"{format_affordability(player, 'house')}"
         ),
         'town_hall': lambda player: (
             "Town Hall\n"
             "Improves morale.\n"
             "Increases your actions per day by one.\n"
             f"Current Town Halls: {player.buildings['town_hall']}\n"
-            f"Cost:\n | {format_cost(BUILDINGCOSTS['town_hall'])} |"
+            f"Cost:\n | {format_cost(BUILDINGCOSTS['town_hall'])} |\n"
+            f"{format_affordability(player, 'town_hall')}"
         ),
     }
 }